@@ -0,0 +1,139 @@
+import argparse
+import os
+import subprocess
+import sys
+from Net_bit import connect
+
+ENGINE_COMMAND = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Uci_bit.py")]
+
+
+class EngineProcess:
+    """A Uci_bit.py process (or any engine speaking its protocol) driven over pipes."""
+
+    def __init__(self, command=ENGINE_COMMAND):
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, bufsize=1)
+        self.send("uci")
+        self.wait_for("uciok")
+
+    def send(self, line):
+        self.process.stdin.write(line + "\n")
+        self.process.stdin.flush()
+
+    def wait_for(self, prefix):
+        """Read engine output until a line starting with prefix; returns that line's words."""
+        while True:
+            line = self.process.stdout.readline()
+            if not line:
+                raise EOFError("engine exited")
+            if line.startswith(prefix):
+                return line.split()
+
+    def close(self):
+        self.send("quit")
+        self.process.wait()
+
+
+# ---------------------------
+# One game on the Server_bit.py socket protocol, with the persistent engine
+# doing the thinking: the engine process, its tables and caches outlive the game.
+def play_game(engine, host, port, ponder=False):
+    client_socket = connect(host, port)
+    player_color = "W"
+    setup = None
+    moves = []
+    clock = None
+    expected = None      # predicted opponent reply while pondering
+    ponder_hit = False
+
+    def position(extra=()):
+        engine.send(f"position setup {' '.join(setup.split()[1:])} moves {' '.join(moves + list(extra))}")
+
+    def go(mode=""):
+        clock_limit = "" if clock is None else f" {'wtime' if player_color == 'W' else 'btime'} {int(clock * 1000)}"
+        engine.send(f"go{mode}{clock_limit}")
+
+    game_active = False
+    while True:
+        data = client_socket.recv()
+        if data is None:
+            break
+        if data == "Connected to the server!":
+            client_socket.send("OK")
+        elif data.startswith("Color"):
+            player_color = data.split()[1]
+            print(f"My color is: {player_color}")
+            client_socket.send("OK")
+        elif data.startswith("Setup"):
+            print(f"Setting up the board: {data}")
+            setup = data
+            moves = []
+            engine.send("ucinewgame")
+            engine.send("isready")
+            engine.wait_for("readyok")
+            client_socket.send("OK")
+        elif data.isdigit():
+            clock = float(data)
+            client_socket.send("OK")
+        elif data == "Begin":
+            print("Game is starting!")
+            game_active = True
+        elif data == "Your turn" and game_active:
+            if not ponder_hit:
+                position()
+                go()
+            words = engine.wait_for("bestmove")
+            expected = None
+            ponder_hit = False
+            move = words[1]
+            print(f"Agent move ({player_color}): {move}")
+            client_socket.send(move)
+            moves.append(move)
+            if ponder and len(words) == 4:
+                expected = words[3]
+                position((expected,))
+                go(" ponder")
+        elif data.startswith("TimeRemaining"):
+            clock = float(data.split()[1])
+        elif data == "exit":
+            print("Game over. Disconnecting.")
+            break
+        elif len(data) == 4:
+            print(f"Opponent moved: {data}")
+            moves.append(data)
+            if expected is not None:
+                if data == expected:
+                    engine.send("ponderhit")
+                    ponder_hit = True
+                else:
+                    engine.send("stop")
+                    engine.wait_for("bestmove")
+                expected = None
+    if expected is not None or ponder_hit:
+        engine.send("stop")
+        engine.wait_for("bestmove")
+    client_socket.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bridge a persistent engine process to the game server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9999)
+    parser.add_argument("--games", type=int, default=1, help="games to play one after another (0 = until interrupted)")
+    parser.add_argument("--ponder", action="store_true", help="search on the opponent's time")
+    parser.add_argument("--engine", nargs=argparse.REMAINDER, default=ENGINE_COMMAND,
+                        help="engine command line (default: Uci_bit.py with this interpreter)")
+    args = parser.parse_args()
+    engine = EngineProcess(args.engine)
+    games = 0
+    try:
+        while not args.games or games < args.games:
+            play_game(engine, args.host, args.port, args.ponder)
+            games += 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        engine.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import argparse
+import contextlib
+import importlib
+import io
+import sys
+import time
+from board import ChessBoard
+from Perft_bit import setup_board
+
+# Fixed suite searched by every engine: opening, middle game, a race and a
+# sparse ending, each with both sides to move.
+BENCH_SUITE = [
+    ("Setup Wa2 Wb2 Wc2 Wd2 We2 Wf2 Wg2 Wh2 Ba7 Bb7 Bc7 Bd7 Be7 Bf7 Bg7 Bh7", "W"),
+    ("Setup Wa2 Wb3 Wc4 We2 Wf2 Wh4 Ba7 Bb5 Bd7 Be5 Bf7 Bg6", "W"),
+    ("Setup Wa2 Wb3 Wc4 We2 Wf2 Wh4 Ba7 Bb5 Bd7 Be5 Bf7 Bg6", "B"),
+    ("Setup Wa4 Wc5 Wd2 We4 Wg2 Bb7 Bc7 Bd5 Bf7 Bg7 Bh5", "W"),
+    ("Setup Wa4 Wc5 Wd2 We4 Wg2 Bb7 Bc7 Bd5 Bf7 Bg7 Bh5", "B"),
+    ("Setup Wb5 Wd5 Wf2 Wh2 Ba7 Bc7 Be7 Bg7", "W"),
+    ("Setup Wb5 Wd5 Wf2 Wh2 Ba7 Bc7 Be7 Bg7", "B"),
+    ("Setup Wc3 Wf4 Wg2 Bb6 Be6 Bh7", "W"),
+]
+
+
+# ---------------------------
+# Engine adapters: each runs one fixed-depth search with the engine's own
+# iterative deepening, from a cold table, and returns the best move.
+@contextlib.contextmanager
+def counted(engine, *names):
+    """Count calls to the engine's search functions (recursion goes through the module globals)."""
+    calls = [0]
+    originals = {name: getattr(engine, name) for name in names}
+
+    def wrap(function):
+        def counting(*args, **kwargs):
+            calls[0] += 1
+            return function(*args, **kwargs)
+        return counting
+
+    for name, function in originals.items():
+        setattr(engine, name, wrap(function))
+    try:
+        yield calls
+    finally:
+        for name, function in originals.items():
+            setattr(engine, name, function)
+
+
+def search_minimax(engine, position, side, depth):
+    board = ChessBoard()
+    board.initialize_custom_board(position)
+    with counted(engine, "minimax") as calls:
+        move = engine.iterative_deepening_minimax(board, depth, side, time_limit=float("inf"))
+    return move, calls[0]
+
+
+def search_pvs(engine, position, side, depth):
+    board = ChessBoard()
+    board.initialize_custom_board(position)
+    with counted(engine, "pvs") as calls:
+        move = engine.iterative_deepening_pvs(board, depth, side, time_limit=float("inf"))
+    return move, calls[0]
+
+
+def search_client(engine, position, side, depth):
+    engine.TRANSPOSITION_TABLE.clear()
+    with counted(engine, "pvs") as calls:
+        move = engine.iterative_deepening_pvs(setup_board(position, side), depth, side, time_limit=float("inf"))
+    return move, calls[0]
+
+
+def search_qsearch(engine, position, side, depth):
+    engine.TRANSPOSITION_TABLE.clear()
+    engine.move_count = 0
+    with counted(engine, "pvs", "quiesce") as calls:
+        move = engine.iterative_deepening_pvs(setup_board(position, side), depth, side, time_limit=float("inf"))
+    return move, calls[0]
+
+
+def search_aspiration(engine, position, side, depth):
+    # The tablebase file is optional (built locally), so it stays out of the signature.
+    engine.TABLEBASE = None
+    engine.TRANSPOSITION_TABLE.clear()
+    engine.QUIESCENCE_CACHE.clear()
+    engine.clear_heuristics()
+    move = engine.iterative_deepening_pvs(setup_board(position, side), depth, side, time_limit=float("inf"))
+    return move, engine.search_nodes
+
+
+# name: (module, search adapter, depth, expected nodes over BENCH_SUITE at that depth)
+ENGINES = {
+    "minimax": ("MiniMaxAlphaBeta", search_minimax, 6, 53524),
+    "pvs": ("PVSsearch", search_pvs, 6, 37405),
+    "client": ("Client_bit", search_client, 8, 238241),
+    "qsearch": ("Qusince", search_qsearch, 8, 330483),
+    "aspiration": ("Engine_bit", search_aspiration, 9, 552244),
+}
+
+
+def bench(name, depth=None):
+    """Search BENCH_SUITE with one engine; returns (nodes, seconds, signature matched or None for a custom depth)."""
+    module, search, default_depth, expected = ENGINES[name]
+    depth = depth or default_depth
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = importlib.import_module(module)
+    nodes = 0
+    start_time = time.perf_counter()
+    for position, side in BENCH_SUITE:
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, position_nodes = search(engine, position, side, depth)
+        nodes += position_nodes
+    elapsed = time.perf_counter() - start_time
+    return nodes, elapsed, (nodes == expected) if depth == default_depth else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search a fixed position suite and check the node-count signature.")
+    parser.add_argument("engines", nargs="*", metavar="ENGINE",
+                        help=f"engines to run: {', '.join(ENGINES)} (default: all)")
+    parser.add_argument("--depth", type=int, default=None,
+                        help="search depth instead of each engine's default (skips the signature check)")
+    args = parser.parse_args()
+    for name in args.engines:
+        if name not in ENGINES:
+            parser.error(f"unknown engine {name!r}")
+
+    failed = []
+    total_nodes = total_time = 0
+    for name in args.engines or ENGINES:
+        nodes, elapsed, matched = bench(name, args.depth)
+        total_nodes += nodes
+        total_time += elapsed
+        status = "" if matched is None else "  ok" if matched else f"  CHANGED (expected {ENGINES[name][3]})"
+        print(f"{name:>10}: {nodes:>10} nodes | {elapsed:8.3f}s | {nodes / max(elapsed, 1e-9):>9.0f} nps{status}")
+        if matched is False:
+            failed.append(name)
+    print(f"Total time (s) : {total_time:.3f}")
+    print(f"Nodes searched : {total_nodes}")
+    print(f"Nodes/second   : {total_nodes / max(total_time, 1e-9):.0f}")
+    if failed:
+        print(f"Node signature changed: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
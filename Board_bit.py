@@ -10,8 +10,78 @@ zobrist_white = [random.getrandbits(64) for _ in range(64)]
 zobrist_black = [random.getrandbits(64) for _ in range(64)]
 zobrist_en_passant = [random.getrandbits(64) for _ in range(64)]
 zobrist_current_player = [random.getrandbits(64), random.getrandbits(64)]
+# The same keys indexed by the mirrored square, for mirror_hash.
+zobrist_white_mirror = [zobrist_white[square ^ 7] for square in range(64)]
+zobrist_black_mirror = [zobrist_black[square ^ 7] for square in range(64)]
+zobrist_en_passant_mirror = [zobrist_en_passant[square ^ 7] for square in range(64)]
+
+# Packed moves: bits 0-5 from square, bits 6-11 to square, bits 12-14 flags.
+MOVE_DOUBLE_PUSH = 1 << 12
+MOVE_CAPTURE = 1 << 13
+MOVE_EN_PASSANT = 1 << 14
+SQUARE_NAMES = [f"{chr(97 + col)}{8 - row}" for row, col in PRECOMPUTED_ROW_COL]
+
+# File mirror (a <-> h): the game is symmetric under it. A square's file is its
+# low three bits, so mirroring a move flips them in both squares.
+MIRROR_MOVE = 7 | (7 << 6)
+
+
+def mirror_move(move):
+    return move ^ MIRROR_MOVE
+
+
+def mirror_files(bitboard):
+    """Reverse the bits of every byte (row): swap neighbouring bits, pairs, then nibbles."""
+    bitboard = ((bitboard >> 1) & 0x5555555555555555) | ((bitboard & 0x5555555555555555) << 1)
+    bitboard = ((bitboard >> 2) & 0x3333333333333333) | ((bitboard & 0x3333333333333333) << 2)
+    return ((bitboard >> 4) & 0x0F0F0F0F0F0F0F0F) | ((bitboard & 0x0F0F0F0F0F0F0F0F) << 4)
+
+
+def move_to_notation(move):
+    return SQUARE_NAMES[move & 0x3F] + SQUARE_NAMES[(move >> 6) & 0x3F]
+
+
+def move_to_tuple(move):
+    """Unpack a move into ((row, col), (row, col)) for the UI."""
+    return PRECOMPUTED_ROW_COL[move & 0x3F], PRECOMPUTED_ROW_COL[(move >> 6) & 0x3F]
+
+
+def move_from_positions(board, start_pos, end_pos, player_color):
+    """Pack a (row, col) -> (row, col) move, deriving its flags from the board."""
+    start = start_pos[0] * 8 + start_pos[1]
+    end = end_pos[0] * 8 + end_pos[1]
+    move = start | (end << 6)
+    if abs(start_pos[0] - end_pos[0]) == 2:
+        move |= MOVE_DOUBLE_PUSH
+    elif start_pos[1] != end_pos[1]:
+        opponent_pawns = board.black_pawns if player_color == 'W' else board.white_pawns
+        if opponent_pawns & (1 << end):
+            move |= MOVE_CAPTURE
+        elif board.en_passant_target == 1 << end:
+            move |= MOVE_EN_PASSANT
+    return move
+
+
+def notation_to_move(board, notation, player_color):
+    """Parse a move such as "e2e4" received over the socket."""
+    start_pos = (8 - int(notation[1]), ord(notation[0]) - 97)
+    end_pos = (8 - int(notation[3]), ord(notation[2]) - 97)
+    return move_from_positions(board, start_pos, end_pos, player_color)
+
+# Material + advancement per square (the evaluate_board scale): 100 per pawn,
+# 3 per row advanced. psqt_score is kept from White's point of view.
+WHITE_PSQT = [100 + 3 * (7 - row) for row, _ in PRECOMPUTED_ROW_COL]
+BLACK_PSQT = [100 + 3 * row for row, _ in PRECOMPUTED_ROW_COL]
+
+# Undo stack: one fixed-size record per ply (pawns, en passant target, last move, side, hash,
+# psqt score, mirror hash), stored flat in a preallocated list so make/unmake never allocates.
+UNDO_RECORD = 8
+UNDO_STACK_PLIES = 256
 
 class ChessBoardChessBoard_Bit:
+    __slots__ = ("white_pawns", "black_pawns", "en_passant_target", "last_move",
+                 "current_player", "zobrist_hash", "mirror_hash", "psqt_score", "_undo", "_ply")
+
     def __init__(self):
         # Initial pawn placement: white pawns on rank 7 and black pawns on rank 2.
         self.white_pawns = 0x00FF000000000000
@@ -20,17 +90,41 @@ class ChessBoardChessBoard_Bit:
         self.last_move = None
         self.current_player = 'W'  # White starts
         self.zobrist_hash = 0
+        self.mirror_hash = 0
+        self._undo = [None] * (UNDO_RECORD * UNDO_STACK_PLIES)
+        self._ply = 0
         self._initialize_zobrist_hash()
-        
+        self._initialize_psqt_score()
+
+    def _initialize_psqt_score(self):
+        """Sum the material + advancement tables over all pawns."""
+        score = 0
+        mask = self.white_pawns
+        while mask:
+            lsb = mask & -mask
+            score += WHITE_PSQT[lsb.bit_length() - 1]
+            mask ^= lsb
+        mask = self.black_pawns
+        while mask:
+            lsb = mask & -mask
+            score -= BLACK_PSQT[lsb.bit_length() - 1]
+            mask ^= lsb
+        self.psqt_score = score
+
     def _initialize_zobrist_hash(self):
-        """Calculate initial hash for starting position."""
+        """
+        Calculate initial hash for starting position, and mirror_hash: the hash
+        of the same position with files a-h mirrored.
+        """
         self.zobrist_hash = 0
+        self.mirror_hash = 0
         # Process white pawns
         mask = self.white_pawns
         while mask:
             lsb = mask & -mask
             pos = lsb.bit_length() - 1
             self.zobrist_hash ^= zobrist_white[pos]
+            self.mirror_hash ^= zobrist_white[pos ^ 7]
             mask ^= lsb
         # Process black pawns
         mask = self.black_pawns
@@ -38,9 +132,16 @@ class ChessBoardChessBoard_Bit:
             lsb = mask & -mask
             pos = lsb.bit_length() - 1
             self.zobrist_hash ^= zobrist_black[pos]
+            self.mirror_hash ^= zobrist_black[pos ^ 7]
             mask ^= lsb
-        # Add current player (white to move)
-        self.zobrist_hash ^= zobrist_current_player[0]
+        if self.en_passant_target:
+            pos = self.en_passant_target.bit_length() - 1
+            self.zobrist_hash ^= zobrist_en_passant[pos]
+            self.mirror_hash ^= zobrist_en_passant[pos ^ 7]
+        # Add current player
+        side = zobrist_current_player[self.current_player == "B"]
+        self.zobrist_hash ^= side
+        self.mirror_hash ^= side
 
     def initialize_custom_board(self, setup_message):
         """Initialize board from a custom setup message."""
@@ -56,93 +157,123 @@ class ChessBoardChessBoard_Bit:
                 self.white_pawns |= bit
             else:
                 self.black_pawns |= bit
-        # Recompute hash after custom setup
+        # Recompute hash and incremental scores after custom setup
         self._initialize_zobrist_hash()
+        self._initialize_psqt_score()
+        self._ply = 0
 
-    def make_move(self, start_pos, end_pos, player_color):
+    def make_move(self, move, player_color):
         """
-        Applies a move in-place and returns a dictionary with the previous state
-        so that the move can be undone later.
+        Applies a packed move in-place and pushes what undo_move needs onto the
+        undo stack.
         """
-        # Save current state for undoing.
-        stored_info = {
-            "white_pawns": self.white_pawns,
-            "black_pawns": self.black_pawns,
-            "en_passant_target": self.en_passant_target,
-            "last_move": self.last_move,
-            "current_player": self.current_player,
-            "zobrist_hash": self.zobrist_hash,
-        }
-        start_row, start_col = start_pos
-        end_row, end_col = end_pos
-        start_bit = 1 << (start_row * 8 + start_col)
-        end_bit = 1 << (end_row * 8 + end_col)
-
-        # --- Remove moving pawn from its source square ---
-        if player_color == 'W':
-            self.white_pawns ^= start_bit
-            self.zobrist_hash ^= zobrist_white[start_bit.bit_length() - 1]
-        else:
-            self.black_pawns ^= start_bit
-            self.zobrist_hash ^= zobrist_black[start_bit.bit_length() - 1]
-
-        # --- Handle captures ---
-        if abs(start_col - end_col) == 1:
-            # Regular capture: if an opponent pawn is on the destination.
-            if player_color == 'W' and (self.black_pawns & end_bit):
-                self.black_pawns ^= end_bit
-                self.zobrist_hash ^= zobrist_black[end_bit.bit_length() - 1]
-            elif player_color == 'B' and (self.white_pawns & end_bit):
-                self.white_pawns ^= end_bit
-                self.zobrist_hash ^= zobrist_white[end_bit.bit_length() - 1]
-            # En passant capture
-            elif self.en_passant_target and end_bit == self.en_passant_target:
-                ep_row = 3 if player_color == 'W' else 4
-                ep_pos = ep_row * 8 + end_col
-                ep_bit = 1 << ep_pos
-                if player_color == 'W':
-                    self.black_pawns ^= ep_bit
-                    self.zobrist_hash ^= zobrist_black[ep_pos]
-                else:
-                    self.white_pawns ^= ep_bit
-                    self.zobrist_hash ^= zobrist_white[ep_pos]
+        undo = self._undo
+        i = self._ply
+        if i == len(undo):
+            undo.extend([None] * (UNDO_RECORD * UNDO_STACK_PLIES))
+        undo[i] = self.white_pawns
+        undo[i + 1] = self.black_pawns
+        undo[i + 2] = self.en_passant_target
+        undo[i + 3] = self.last_move
+        undo[i + 4] = self.current_player
+        undo[i + 5] = self.zobrist_hash
+        undo[i + 6] = self.psqt_score
+        undo[i + 7] = self.mirror_hash
+        self._ply = i + UNDO_RECORD
+
+        start = move & 0x3F
+        end = (move >> 6) & 0x3F
+        move_bits = (1 << start) | (1 << end)
 
-        # --- Add moving pawn to its destination square ---
+        # --- Move the pawn and handle captures ---
         if player_color == 'W':
-            self.white_pawns ^= end_bit
-            self.zobrist_hash ^= zobrist_white[end_bit.bit_length() - 1]
+            self.white_pawns ^= move_bits
+            self.zobrist_hash ^= zobrist_white[start] ^ zobrist_white[end]
+            self.mirror_hash ^= zobrist_white_mirror[start] ^ zobrist_white_mirror[end]
+            self.psqt_score += WHITE_PSQT[end] - WHITE_PSQT[start]
+            if move & MOVE_CAPTURE:
+                self.black_pawns ^= 1 << end
+                self.zobrist_hash ^= zobrist_black[end]
+                self.mirror_hash ^= zobrist_black_mirror[end]
+                self.psqt_score += BLACK_PSQT[end]
+            elif move & MOVE_EN_PASSANT:
+                # The captured pawn sits one row behind the target square.
+                self.black_pawns ^= 1 << (end + 8)
+                self.zobrist_hash ^= zobrist_black[end + 8]
+                self.mirror_hash ^= zobrist_black_mirror[end + 8]
+                self.psqt_score += BLACK_PSQT[end + 8]
         else:
-            self.black_pawns ^= end_bit
-            self.zobrist_hash ^= zobrist_black[end_bit.bit_length() - 1]
+            self.black_pawns ^= move_bits
+            self.zobrist_hash ^= zobrist_black[start] ^ zobrist_black[end]
+            self.mirror_hash ^= zobrist_black_mirror[start] ^ zobrist_black_mirror[end]
+            self.psqt_score -= BLACK_PSQT[end] - BLACK_PSQT[start]
+            if move & MOVE_CAPTURE:
+                self.white_pawns ^= 1 << end
+                self.zobrist_hash ^= zobrist_white[end]
+                self.mirror_hash ^= zobrist_white_mirror[end]
+                self.psqt_score -= WHITE_PSQT[end]
+            elif move & MOVE_EN_PASSANT:
+                self.white_pawns ^= 1 << (end - 8)
+                self.zobrist_hash ^= zobrist_white[end - 8]
+                self.mirror_hash ^= zobrist_white_mirror[end - 8]
+                self.psqt_score -= WHITE_PSQT[end - 8]
 
         # --- Update en passant target ---
         if self.en_passant_target:
-            old_ep_pos = self.en_passant_target.bit_length() - 1
-            self.zobrist_hash ^= zobrist_en_passant[old_ep_pos]
-        new_ep = None
-        if abs(start_row - end_row) == 2:
-            mid_row = (start_row + end_row) // 2
-            new_ep = 1 << (mid_row * 8 + start_col)
-            self.zobrist_hash ^= zobrist_en_passant[mid_row * 8 + start_col]
-        self.en_passant_target = new_ep
+            ep = self.en_passant_target.bit_length() - 1
+            self.zobrist_hash ^= zobrist_en_passant[ep]
+            self.mirror_hash ^= zobrist_en_passant_mirror[ep]
+        if move & MOVE_DOUBLE_PUSH:
+            mid = (start + end) >> 1
+            self.en_passant_target = 1 << mid
+            self.zobrist_hash ^= zobrist_en_passant[mid]
+            self.mirror_hash ^= zobrist_en_passant_mirror[mid]
+        else:
+            self.en_passant_target = None
 
         # --- Toggle current player ---
-        self.zobrist_hash ^= zobrist_current_player[0]
-        self.zobrist_hash ^= zobrist_current_player[1]
+        side = zobrist_current_player[0] ^ zobrist_current_player[1]
+        self.zobrist_hash ^= side
+        self.mirror_hash ^= side
         self.current_player = 'B' if self.current_player == 'W' else 'W'
 
         # Update last move
-        self.last_move = (start_pos, end_pos)
-        return stored_info
-
-    def undo_move(self, stored_info):
-        """Reverts the board state to the values stored in stored_info."""
-        self.white_pawns = stored_info["white_pawns"]
-        self.black_pawns = stored_info["black_pawns"]
-        self.en_passant_target = stored_info["en_passant_target"]
-        self.last_move = stored_info["last_move"]
-        self.current_player = stored_info["current_player"]
-        self.zobrist_hash = stored_info["zobrist_hash"]
+        self.last_move = move
+
+    def undo_move(self):
+        """Reverts the last make_move by popping its record off the undo stack."""
+        i = self._ply - UNDO_RECORD
+        self._ply = i
+        undo = self._undo
+        self.white_pawns = undo[i]
+        self.black_pawns = undo[i + 1]
+        self.en_passant_target = undo[i + 2]
+        self.last_move = undo[i + 3]
+        self.current_player = undo[i + 4]
+        self.zobrist_hash = undo[i + 5]
+        self.psqt_score = undo[i + 6]
+        self.mirror_hash = undo[i + 7]
+
+    @property
+    def ply(self):
+        """Number of moves undo_move can take back."""
+        return self._ply // UNDO_RECORD
+
+    def undo_to(self, ply):
+        """Undo moves until ply moves remain, e.g. to leave an aborted search at its root."""
+        while self._ply > ply * UNDO_RECORD:
+            self.undo_move()
+
+    def snapshot(self):
+        """Picklable copy of the position (same fields as an undo record)."""
+        return (self.white_pawns, self.black_pawns, self.en_passant_target, self.last_move,
+                self.current_player, self.zobrist_hash, self.psqt_score, self.mirror_hash)
+
+    def restore(self, state):
+        """Load a snapshot() and drop any pending undo records."""
+        (self.white_pawns, self.black_pawns, self.en_passant_target, self.last_move,
+         self.current_player, self.zobrist_hash, self.psqt_score, self.mirror_hash) = state
+        self._ply = 0
 
     # --- Other utility functions (move generation, game state checks, etc.) ---
     def _can_move_forward(self, row, col, direction):
@@ -177,33 +308,7 @@ class ChessBoardChessBoard_Bit:
         return False
 
     def has_moves(self, player_color):
-        pawns = self.white_pawns if player_color == "W" else self.black_pawns
-        direction = -1 if player_color == "W" else 1
-        all_pawns = self.white_pawns | self.black_pawns
-        while pawns:
-            lsb = pawns & -pawns
-            pos = lsb.bit_length() - 1
-            pawns ^= lsb
-            row, col = divmod(pos, 8)
-            forward_pos = pos + direction * 8
-            if 0 <= row + direction < 8 and not (all_pawns & (1 << forward_pos)):
-                return True
-            for dc in [-1, 1]:
-                if 0 <= col + dc < 8:
-                    capture_pos = pos + direction * 8 + dc
-                    opponent_pawns = self.black_pawns if player_color == "W" else self.white_pawns
-                    if opponent_pawns & (1 << capture_pos):
-                        return True
-            if self.en_passant_target:
-                ep_row, ep_col = divmod(self.en_passant_target.bit_length() - 1, 8)
-                if (player_color == "W" and row == 3 and ep_row == 2 and abs(col - ep_col) == 1) or \
-                   (player_color == "B" and row == 4 and ep_row == 5 and abs(col - ep_col) == 1):
-                    adjacent_col = ep_col
-                    adjacent_bit = 1 << (row * 8 + adjacent_col)
-                    opponent_pawns = self.black_pawns if player_color == "W" else self.white_pawns
-                    if opponent_pawns & adjacent_bit:
-                        return True
-        return False
+        return any(_pawn_targets(self, player_color))
 
     def is_game_over(self, player_color):
         opponent_color = 'B' if player_color == 'W' else 'W'
@@ -249,34 +354,102 @@ class ChessBoardChessBoard_Bit:
 
 
 
-    def get_all_moves(board, player_color):
-        moves = []
-        pawns = board.white_pawns if player_color == "W" else board.black_pawns
-        opponent_pawns = board.black_pawns if player_color == "W" else board.white_pawns
-        direction = -1 if player_color == "W" else 1
-        all_pawns = pawns | opponent_pawns
-        while pawns:
-            lsb_val = pawns & -pawns
-            pos = LSB_INDEX_TABLE[lsb_val]
-            row, col = PRECOMPUTED_ROW_COL[pos]
-            pawns ^= lsb_val
-            if (row + direction) >= 0 and (row + direction) < 8:
-                forward = pos + (direction * 8)
-                if not (all_pawns & (1 << forward)):
-                    moves.append(((row, col), (row + direction, col)))
-            if (player_color == "W" and row == 6) or (player_color == "B" and row == 1):
-                double_forward = pos + (2 * direction * 8)
-                if not (all_pawns & (1 << double_forward)) and not (all_pawns & (1 << (pos + direction * 8))):
-                    moves.append(((row, col), (row + 2 * direction, col)))
-            for dc in [-1, 1]:
-                if 0 <= col + dc < 8:
-                    capture_pos = pos + direction * 8 + dc
-                    if opponent_pawns & (1 << capture_pos):
-                        moves.append(((row, col), (row + direction, col + dc)))
-            if board.en_passant_target:
-                ep_pos = board.en_passant_target.bit_length() - 1
-                ep_row, ep_col = divmod(ep_pos, 8)
-                if (player_color == "W" and row == 3 and ep_row == 2) or (player_color == "B" and row == 4 and ep_row == 5):
-                    if abs(col - ep_col) == 1:
-                        moves.append(((row, col), (ep_row, ep_col)))
-        return moves
+    def get_all_moves(self, player_color):
+        return get_all_moves(self, player_color)
+
+    def canonical_key(self):
+        """(key, mirrored): the smaller of zobrist_hash and mirror_hash, and whether it is the mirror's."""
+        if self.mirror_hash < self.zobrist_hash:
+            return self.mirror_hash, True
+        return self.zobrist_hash, False
+
+    def is_symmetric(self):
+        """The position equals its file mirror, so a move and its mirror lead to equivalent positions."""
+        return self.zobrist_hash == self.mirror_hash
+
+
+# ---------------------------
+# Set-wise move generation
+# White moves toward row 0 (index - 8), black toward row 7 (index + 8).
+FULL_MASK = 0xFFFFFFFFFFFFFFFF
+FILE_A = 0x0101010101010101
+FILE_H = 0x8080808080808080
+NOT_FILE_A = FULL_MASK ^ FILE_A
+NOT_FILE_H = FULL_MASK ^ FILE_H
+ROW_2 = 0x0000000000FF0000  # White en passant targets, black single pushes from the start row
+ROW_5 = 0x0000FF0000000000  # Black en passant targets, white single pushes from the start row
+
+
+def _serialize(targets, offset, flags, moves):
+    """Append one packed move per set bit of targets; the source square is target + offset."""
+    while targets:
+        lsb = targets & -targets
+        to = lsb.bit_length() - 1
+        moves.append((to + offset) | (to << 6) | flags)
+        targets ^= lsb
+
+
+def _pawn_targets(board, player_color):
+    """
+    Return (single, double, left, right, ep_left, ep_right) target sets for a side.
+    left/right are captures toward the a-file / h-file.
+    """
+    wp = board.white_pawns
+    bp = board.black_pawns
+    empty = ~(wp | bp) & FULL_MASK
+    ep = board.en_passant_target or 0
+    if player_color == "W":
+        single = (wp >> 8) & empty
+        double = ((single & ROW_5) >> 8) & empty
+        left = ((wp & NOT_FILE_A) >> 9) & bp
+        right = ((wp & NOT_FILE_H) >> 7) & bp
+        ep &= ROW_2
+        ep_left = ((wp & NOT_FILE_A) >> 9) & ep
+        ep_right = ((wp & NOT_FILE_H) >> 7) & ep
+    else:
+        single = (bp << 8) & empty
+        double = ((single & ROW_2) << 8) & empty
+        left = ((bp & NOT_FILE_A) << 7) & wp
+        right = ((bp & NOT_FILE_H) << 9) & wp
+        ep &= ROW_5
+        ep_left = ((bp & NOT_FILE_A) << 7) & ep
+        ep_right = ((bp & NOT_FILE_H) << 9) & ep
+    return single, double, left, right, ep_left, ep_right
+
+
+def get_all_moves(board, player_color):
+    """All legal pawn moves for player_color as packed ints."""
+    single, double, left, right, ep_left, ep_right = _pawn_targets(board, player_color)
+    moves = []
+    if player_color == "W":
+        _serialize(single, 8, 0, moves)
+        _serialize(double, 16, MOVE_DOUBLE_PUSH, moves)
+        _serialize(left, 9, MOVE_CAPTURE, moves)
+        _serialize(right, 7, MOVE_CAPTURE, moves)
+        _serialize(ep_left, 9, MOVE_EN_PASSANT, moves)
+        _serialize(ep_right, 7, MOVE_EN_PASSANT, moves)
+    else:
+        _serialize(single, -8, 0, moves)
+        _serialize(double, -16, MOVE_DOUBLE_PUSH, moves)
+        _serialize(left, -7, MOVE_CAPTURE, moves)
+        _serialize(right, -9, MOVE_CAPTURE, moves)
+        _serialize(ep_left, -7, MOVE_EN_PASSANT, moves)
+        _serialize(ep_right, -9, MOVE_EN_PASSANT, moves)
+    return moves
+
+
+def get_captures(board, player_color):
+    """Captures only (regular and en passant), same format as get_all_moves."""
+    _, _, left, right, ep_left, ep_right = _pawn_targets(board, player_color)
+    moves = []
+    if player_color == "W":
+        _serialize(left, 9, MOVE_CAPTURE, moves)
+        _serialize(right, 7, MOVE_CAPTURE, moves)
+        _serialize(ep_left, 9, MOVE_EN_PASSANT, moves)
+        _serialize(ep_right, 7, MOVE_EN_PASSANT, moves)
+    else:
+        _serialize(left, -7, MOVE_CAPTURE, moves)
+        _serialize(right, -9, MOVE_CAPTURE, moves)
+        _serialize(ep_left, -7, MOVE_EN_PASSANT, moves)
+        _serialize(ep_right, -9, MOVE_EN_PASSANT, moves)
+    return moves
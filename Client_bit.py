@@ -1,11 +1,12 @@
 import random
-import socket
-import pygame
 import time
-from Board_bit import ChessBoardChessBoard_Bit, zobrist_white, zobrist_black, zobrist_en_passant, zobrist_current_player
+from Board_bit import ChessBoardChessBoard_Bit, get_all_moves, move_to_notation, notation_to_move, MOVE_CAPTURE, zobrist_white, zobrist_black, zobrist_en_passant, zobrist_current_player
+from Net_bit import connect
 
 CHECKMATE = 100000000000
 LOSE = -100000000000
+# Full search window; wider than the mate scores so they come back exact.
+INFINITY = CHECKMATE + 1
 
 # Bitwise operations for move generation
 LSB_INDEX_TABLE = {}
@@ -168,73 +169,33 @@ def is_en_passant_possible(board, pos, player_color):
     opponent_pawns = board.black_pawns if player_color == "W" else board.white_pawns
     return bool(opponent_pawns & adjacent_mask)
 
-def get_all_moves(board, player_color):
-    moves = []
-    pawns = board.white_pawns if player_color == "W" else board.black_pawns
-    opponent_pawns = board.black_pawns if player_color == "W" else board.white_pawns
-    direction = -1 if player_color == "W" else 1
-    all_pawns = pawns | opponent_pawns
-    while pawns:
-        lsb_val = pawns & -pawns
-        pos = LSB_INDEX_TABLE[lsb_val]
-        row, col = PRECOMPUTED_ROW_COL[pos]
-        pawns ^= lsb_val
-        if (row + direction) >= 0 and (row + direction) < 8:
-            forward = pos + (direction * 8)
-            if not (all_pawns & (1 << forward)):
-                moves.append(((row, col), (row + direction, col)))
-        if (player_color == "W" and row == 6) or (player_color == "B" and row == 1):
-            double_forward = pos + (2 * direction * 8)
-            if not (all_pawns & (1 << double_forward)) and not (all_pawns & (1 << (pos + direction * 8))):
-                moves.append(((row, col), (row + 2 * direction, col)))
-        for dc in [-1, 1]:
-            if 0 <= col + dc < 8:
-                capture_pos = pos + direction * 8 + dc
-                if opponent_pawns & (1 << capture_pos):
-                    moves.append(((row, col), (row + direction, col + dc)))
-        if board.en_passant_target:
-            ep_pos = board.en_passant_target.bit_length() - 1
-            ep_row, ep_col = divmod(ep_pos, 8)
-            if (player_color == "W" and row == 3 and ep_row == 2) or (player_color == "B" and row == 4 and ep_row == 5):
-                if abs(col - ep_col) == 1:
-                    moves.append(((row, col), (ep_row, ep_col)))
-    return moves
-
-def move_to_notation(move):
-    start, end = move
-    return f"{chr(97 + start[1])}{8 - start[0]}{chr(97 + end[1])}{8 - end[0]}"
-
 def order_moves(board, moves, player_color):
     def move_score(move):
-        _, end = move
-        end_row, end_col = end
+        end = (move >> 6) & 0x3F
+        end_row = end >> 3
         score = 0
         if (player_color == "W" and end_row == 0) or (player_color == "B" and end_row == 7):
             score += 10000
-        if 0 <= end_row < 8 and 0 <= end_col < 8:
-            end_bit = 1 << (end_row * 8 + end_col)
-            if (player_color == "W" and (board.black_pawns & end_bit)) or (player_color == "B" and (board.white_pawns & end_bit)):
-                score += 500
-        if 0 <= end_row < 8:
-            score += (7 - end_row) if player_color == "W" else end_row
+        if move & MOVE_CAPTURE:
+            score += 500
+        score += (7 - end_row) if player_color == "W" else end_row
         if player_color == "W" and end_row > 0:
-            above_row = end_row - 1
-            if 0 <= above_row < 8:
-                above_bit = 1 << (above_row * 8 + end_col)
-                if board.black_pawns & above_bit:
-                    score += 200
+            if board.black_pawns & (1 << (end - 8)):
+                score += 200
         elif player_color == "B" and end_row < 7:
-            below_row = end_row + 1
-            if 0 <= below_row < 8:
-                below_bit = 1 << (below_row * 8 + end_col)
-                if board.white_pawns & below_bit:
-                    score += 200
+            if board.white_pawns & (1 << (end + 8)):
+                score += 200
         return -score
     return sorted(moves, key=move_score)
 
 # ---------------------------
-# PV Search (Minimax-AlphaBeta Clone) Using in-place make/undo
-def pvs(board, depth, alpha, beta, maximizing_player, root_color):
+# Principal Variation Search (negamax) using in-place make/undo
+def pvs(board, depth, alpha, beta):
+    """
+    Scores are from the side to move's point of view. The first move gets the
+    full window; later moves are scouted with a null window (alpha, alpha + 1)
+    and searched again with the full window only when the scout fails high.
+    """
     global TRANSPOSITION_TABLE
     entry = TRANSPOSITION_TABLE.get(board.zobrist_hash)
     if entry and entry["depth"] >= depth:
@@ -245,66 +206,47 @@ def pvs(board, depth, alpha, beta, maximizing_player, root_color):
         elif entry["flag"] == HASH_BETA and entry["score"] >= beta:
             return beta, entry["best_move"]
 
-    game_result = board.is_game_over_2(board.current_player)
+    player_color = board.current_player
+    game_result = board.is_game_over_2(player_color)
     if game_result is not None:
-        score = CHECKMATE if game_result == root_color else LOSE
+        score = CHECKMATE if game_result == player_color else LOSE
         TRANSPOSITION_TABLE[board.zobrist_hash] = {"depth": depth, "score": score, "flag": HASH_EXACT, "best_move": None}
         return score, None
 
+    original_alpha = alpha
     if depth == 0:
-        score = evaluate_board(board, root_color)
-        TRANSPOSITION_TABLE[board.zobrist_hash] = {"depth": 0, "score": score, "flag": HASH_EXACT, "best_move": None}
+        score = evaluate_board(board, player_color)
+        flag = HASH_ALPHA if score <= original_alpha else HASH_BETA if score >= beta else HASH_EXACT
+        TRANSPOSITION_TABLE[board.zobrist_hash] = {"depth": 0, "score": score, "flag": flag, "best_move": None}
         return score, None
 
-    moves = get_all_moves(board, board.current_player)
-    moves = order_moves(board, moves, board.current_player)
-    original_alpha = alpha
-    best_move = moves[0] if moves else None
-
-    if maximizing_player:
-        max_eval = -CHECKMATE
-        best_move = None
-        for move in moves:
-            stored_info = board.make_move(move[0], move[1], board.current_player)
-            eval_score, _ = pvs(board, depth-1, alpha, beta, False, root_color)
-            board.undo_move(stored_info)
-            if eval_score > max_eval:
-                max_eval = eval_score
-                best_move = move
-                if max_eval >= beta:
-                    break
-            alpha = max(alpha, max_eval)
+    moves = get_all_moves(board, player_color)
+    moves = order_moves(board, moves, player_color)
+    best_score = LOSE - 1
+    best_move = None
+    for index, move in enumerate(moves):
+        board.make_move(move, player_color)
+        if index == 0:
+            score = -pvs(board, depth - 1, -beta, -alpha)[0]
+        else:
+            score = -pvs(board, depth - 1, -alpha - 1, -alpha)[0]
+            if alpha < score < beta:
+                score = -pvs(board, depth - 1, -beta, -alpha)[0]
+        board.undo_move()
+        if score > best_score:
+            best_score = score
+            best_move = move
+        if score > alpha:
+            alpha = score
             if alpha >= beta:
                 break
-        flag = HASH_EXACT
-        if max_eval <= original_alpha:
-            flag = HASH_ALPHA
-        elif max_eval >= beta:
-            flag = HASH_BETA
-        TRANSPOSITION_TABLE[board.zobrist_hash] = {"depth": depth, "score": max_eval, "flag": flag, "best_move": best_move}
-        return max_eval, best_move
-    else:
-        min_eval = CHECKMATE
-        best_move = None
-        for move in moves:
-            stored_info = board.make_move(move[0], move[1], board.current_player)
-            eval_score, _ = pvs(board, depth-1, alpha, beta, True, root_color)
-            board.undo_move(stored_info)
-            if eval_score < min_eval:
-                min_eval = eval_score
-                best_move = move
-                if min_eval <= alpha:
-                    break
-            beta = min(beta, eval_score)
-            if beta <= alpha:
-                break
-        flag = HASH_EXACT
-        if min_eval <= original_alpha:
-            flag = HASH_ALPHA
-        elif min_eval >= beta:
-            flag = HASH_BETA
-        TRANSPOSITION_TABLE[board.zobrist_hash] = {"depth": depth, "score": min_eval, "flag": flag, "best_move": best_move}
-        return min_eval, best_move
+    flag = HASH_EXACT
+    if best_score <= original_alpha:
+        flag = HASH_ALPHA
+    elif best_score >= beta:
+        flag = HASH_BETA
+    TRANSPOSITION_TABLE[board.zobrist_hash] = {"depth": depth, "score": best_score, "flag": flag, "best_move": best_move}
+    return best_score, best_move
 
 def iterative_deepening_pvs(board, max_depth, player_color, time_limit=100):
     global TRANSPOSITION_TABLE
@@ -314,7 +256,7 @@ def iterative_deepening_pvs(board, max_depth, player_color, time_limit=100):
         elapsed = time.time() - start_time
         if elapsed >= time_limit:
             break
-        eval_score, move = pvs(board, depth, -CHECKMATE, CHECKMATE, True, player_color)
+        eval_score, move = pvs(board, depth, -INFINITY, INFINITY)
         if move:
             best_move = move
             print(f"Depth {depth} Best Move: {move_to_notation(move)} | Eval: {eval_score}")
@@ -332,27 +274,27 @@ def iterative_deepening_pvs(board, max_depth, player_color, time_limit=100):
 # ---------------------------
 # Main Game Loop
 def main():
-    client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    client_socket.connect(('127.0.0.1', 9999))
+    client_socket = connect()
     running = True
     game_active = False
-    clock = pygame.time.Clock()
     board = ChessBoardChessBoard_Bit()
     while running:
-        data = client_socket.recv(1024).decode()
+        data = client_socket.recv()
+        if data is None:  # the server closed the connection
+            break
         if data == "Connected to the server!":
-            client_socket.send("OK".encode())
+            client_socket.send("OK")
         elif data.startswith("Color"):
             player_color = data.split()[1]
             print(f"My color is: {player_color}")
-            client_socket.send("OK".encode())
+            client_socket.send("OK")
         elif data.startswith("Setup"):
             print(f"Setting up the board: {data}")
             board.initialize_custom_board(data)
-            client_socket.send("OK".encode())
+            client_socket.send("OK")
         elif data.isdigit():
             print(f"Game time set to {data} minutes.")
-            client_socket.send("OK".encode())
+            client_socket.send("OK")
         elif data == "Begin":
             print("Game is starting!")
             game_active = True
@@ -362,9 +304,9 @@ def main():
             move = iterative_deepening_pvs(board, max_depth=11, player_color=player_color, time_limit=1000)
             move_notation = move_to_notation(move)
             print(f"Agent move ({player_color}): {move_notation}")
-            client_socket.send(move_notation.encode())
+            client_socket.send(move_notation)
             # Make the move permanently (no need to undo for the real game)
-            board.make_move(move[0], move[1], player_color)
+            board.make_move(move, player_color)
         elif data.startswith("TimeRemaining"):
             client_time_remaining = float(data.split()[1])
             print(f"Client time remaining: {client_time_remaining:.2f} seconds")
@@ -373,12 +315,9 @@ def main():
             break
         elif len(data) == 4:
             print(f"Opponent moved: {data}")
-            start_col, start_row = ord(data[0]) - 97, 8 - int(data[1])
-            end_col, end_row = ord(data[2]) - 97, 8 - int(data[3])
             opponent_color = "B" if player_color == "W" else "W"
-            board.make_move((start_row, start_col), (end_row, end_col), opponent_color)
+            board.make_move(notation_to_move(board, data, opponent_color), opponent_color)
     client_socket.close()
-    pygame.quit()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,733 @@
+import multiprocessing
+import random
+import threading
+import time
+from multiprocessing import shared_memory
+from Board_bit import ChessBoardChessBoard_Bit, get_all_moves, get_captures, move_to_notation, mirror_move, MOVE_CAPTURE, MOVE_EN_PASSANT, MOVE_DOUBLE_PUSH
+import Eval_bit
+from Eval_bit import evaluate_board, fast_eval, pawn_race, WHITE_FRONT_SPAN, BLACK_FRONT_SPAN
+from TT_bit import (TranspositionTable, QuiescenceCache, create_shared_table, attach_shared_table, HASH_EXACT,
+                    HASH_ALPHA, HASH_BETA)
+from TB_bit import open_tablebase
+
+# ---------------------------
+# Search engine of the aspiration agent. No GUI or socket code: aspiration_Bit.py
+# is the network client around it, and the benchmarks import it directly.
+
+CHECKMATE = 100000000000
+LOSE = -100000000000
+# Full search window; wider than the mate scores so they come back exact.
+INFINITY = CHECKMATE + 1
+# Depth cap when the time manager decides when to stop (fits the TT depth field).
+MAX_SEARCH_DEPTH = 64
+
+# Transposition table setup
+TT_SIZE_MB = 64
+TRANSPOSITION_TABLE = TranspositionTable(TT_SIZE_MB)
+# Store a position and its file mirror (a <-> h) under one key: the smaller of
+# the two Zobrist hashes, with the best move mirrored to match.
+CANONICAL_KEYS = True
+# Quiescence results go to their own small cache (per process, not shared by
+# Lazy SMP helpers); TRANSPOSITION_TABLE only takes interior (depth > 0) nodes.
+QCACHE_SIZE_MB = 4
+QUIESCENCE_CACHE = QuiescenceCache(QCACHE_SIZE_MB)
+QCACHE_ENABLED = True
+search_tt_probes = 0
+search_tt_hits = 0
+search_tt_flag_hits = [0, 0, 0]  # by HASH_EXACT / HASH_ALPHA / HASH_BETA
+search_qnodes = 0
+# Telemetry_bit.Telemetry sink for per-iteration JSON records (--telemetry); None = off.
+TELEMETRY = None
+# Non-zero stops the search; Lazy SMP helpers map this onto a shared byte.
+SEARCH_STOP = bytearray(1)
+# pvs/quiesce look at the clock and SEARCH_STOP once every NODE_CHECK_MASK + 1 nodes.
+NODE_CHECK_MASK = 1023
+search_nodes = 0
+search_deadline = float("inf")
+search_node_limit = float("inf")
+
+
+class SearchAborted(Exception):
+    """Raised inside pvs/quiesce once SEARCH_STOP is set or the hard deadline or node limit has passed."""
+
+
+def check_abort():
+    if SEARCH_STOP[0] or time.time() >= search_deadline or search_nodes >= search_node_limit:
+        raise SearchAborted
+
+# ---------------------------
+# Move ordering: TT move first, then promotions and captures, killer moves of
+# this ply, and the remaining quiet moves by butterfly history (colour, from, to).
+# Killers and history are learned from cutoffs of quiet moves.
+ORDERING_HEURISTICS = True
+MAX_PLY = MAX_SEARCH_DEPTH + 1
+KILLERS = [0] * (2 * MAX_PLY)
+HISTORY = [[0] * 4096, [0] * 4096]  # [W, B][from | to << 6]
+HISTORY_LIMIT = 1 << 24
+search_cutoffs = 0
+search_first_cutoffs = 0
+search_scout_researches = 0
+
+
+def order_moves(board, moves, player_color, tt_move=None, ply=None):
+    heuristics = ORDERING_HEURISTICS
+    history = HISTORY[player_color == "B"]
+    killer1 = killer2 = 0
+    if ply is not None:
+        killer1 = KILLERS[2 * ply]
+        killer2 = KILLERS[2 * ply + 1]
+
+    def move_score(move):
+        end = (move >> 6) & 0x3F
+        end_row = end >> 3
+        score = 0
+        if (player_color == "W" and end_row == 0) or (player_color == "B" and end_row == 7):
+            score += 10000
+        if move & MOVE_CAPTURE:
+            score += 500
+        score += (7 - end_row) if player_color == "W" else end_row
+        if player_color == "W" and end_row > 0:
+            if board.black_pawns & (1 << (end - 8)):
+                score += 200
+        elif player_color == "B" and end_row < 7:
+            if board.white_pawns & (1 << (end + 8)):
+                score += 200
+        if not heuristics:
+            return -score
+        if move == tt_move:
+            return -(1 << 40)
+        if score >= 10000 or move & (MOVE_CAPTURE | MOVE_EN_PASSANT):
+            return -((1 << 38) + score)
+        if move == killer1:
+            return -(1 << 37)
+        if move == killer2:
+            return -(1 << 36)
+        return -((history[move & 0xFFF] << 10) + score)
+    return sorted(moves, key=move_score)
+
+
+def record_cutoff(move, depth, ply, player_color, move_index):
+    """Update the statistics, killers and history after move caused a cutoff."""
+    global search_cutoffs, search_first_cutoffs
+    search_cutoffs += 1
+    if move_index == 0:
+        search_first_cutoffs += 1
+    if not ORDERING_HEURISTICS or move & (MOVE_CAPTURE | MOVE_EN_PASSANT):
+        return
+    if KILLERS[2 * ply] != move:
+        KILLERS[2 * ply + 1] = KILLERS[2 * ply]
+        KILLERS[2 * ply] = move
+    history = HISTORY[player_color == "B"]
+    index = move & 0xFFF
+    history[index] += depth * depth
+    if history[index] > HISTORY_LIMIT:
+        for i in range(4096):
+            history[i] >>= 1
+
+
+def percent(part, whole):
+    return 100.0 * part / whole if whole else 0.0
+
+
+def search_stats(elapsed):
+    """Counters of the running search, as reported in telemetry records."""
+    cache = Eval_bit.EVAL_CACHE
+    return {
+        "nodes": search_nodes, "qnodes": search_qnodes, "elapsed": round(elapsed, 4),
+        "nps": round(search_nodes / max(elapsed, 1e-9)),
+        "tt_probes": search_tt_probes, "tt_hits": search_tt_hits, "tt_hits_exact": search_tt_flag_hits[HASH_EXACT],
+        "tt_hits_alpha": search_tt_flag_hits[HASH_ALPHA], "tt_hits_beta": search_tt_flag_hits[HASH_BETA],
+        "qcache_probes": QUIESCENCE_CACHE.probes, "qcache_hits": QUIESCENCE_CACHE.hits,
+        "eval_cache_probes": cache.probes if cache is not None else 0,
+        "eval_cache_hits": cache.hits if cache is not None else 0,
+        "cutoffs": search_cutoffs, "first_move_cutoff_rate": round(first_move_cutoff_rate(), 2),
+        "scout_researches": search_scout_researches, "reductions": search_reductions,
+        "futility_prunes": search_futility_prunes, "razor_cuts": search_razor_cuts,
+        "race_cutoffs": search_race_cutoffs, "tablebase_hits": search_tb_hits, "mirror_skips": search_mirror_skips,
+    }
+
+
+def first_move_cutoff_rate():
+    """Percentage of cutoffs in this search produced by the first move tried."""
+    return 100.0 * search_first_cutoffs / search_cutoffs if search_cutoffs else 0.0
+
+
+def clear_heuristics():
+    """Forget killers and history, e.g. for a new game or a reproducible benchmark."""
+    for history in HISTORY:
+        history[:] = [0] * 4096
+    KILLERS[:] = [0] * len(KILLERS)
+
+
+def age_heuristics(new_move=False):
+    """Halve the history after an iteration; for a new move divide it by 8 and forget the killers."""
+    shift = 3 if new_move else 1
+    for history in HISTORY:
+        for i in range(4096):
+            history[i] >>= shift
+    if new_move:
+        KILLERS[:] = [0] * len(KILLERS)
+
+def order_captures(board, moves, player_color):
+    return sorted(moves, key=lambda m: (
+        -1000 if is_promotion(m) else 
+        -500 if m & MOVE_EN_PASSANT else 
+        0
+    ))
+
+
+def is_promotion(move):
+    end_row = ((move >> 6) & 0x3F) >> 3
+    return end_row == 0 or end_row == 7
+
+
+# ---------------------------
+# Quiescence Search
+def quiesce(board, alpha, beta, player_color, q_depth=0):
+    """Negamax capture search; player_color is the side to move and scores are from its view."""
+    global search_nodes, search_qnodes
+    search_nodes += 1
+    search_qnodes += 1
+    if not search_nodes & NODE_CHECK_MASK:
+        check_abort()
+    # Only the first quiescence ply is cached: deeper ones stand pat on the cheap fast_eval.
+    if QCACHE_ENABLED and not q_depth:
+        key = tt_key(board)[0]
+        entry = QUIESCENCE_CACHE.probe(key, q_depth)
+        if entry is not None:
+            cached_score, cached_flag = entry
+            if cached_flag == HASH_EXACT:
+                return max(alpha, min(beta, cached_score))
+            if cached_flag == HASH_ALPHA and cached_score <= alpha:
+                return alpha
+            if cached_flag == HASH_BETA and cached_score >= beta:
+                return beta
+        score = _quiesce(board, alpha, beta, player_color, q_depth)
+        flag = HASH_ALPHA if score <= alpha else HASH_BETA if score >= beta else HASH_EXACT
+        QUIESCENCE_CACHE.store(key, q_depth, score, flag)
+        return score
+    return _quiesce(board, alpha, beta, player_color, q_depth)
+
+
+def _quiesce(board, alpha, beta, player_color, q_depth):
+    # Use full evaluation for initial stand-pat, fast_eval for deeper quiescence
+    stand_pat = evaluate_board(board, player_color) if q_depth == 0 else fast_eval(board, player_color)
+    
+    if stand_pat >= beta:
+        return beta
+    if stand_pat > alpha:
+        alpha = stand_pat
+
+    # Delta pruning based on max possible material gain (pawn value + buffer)
+    max_gain = 150 if q_depth == 0 else 15  # pawn value + half a pawn, in the scale of stand_pat
+    if stand_pat + max_gain <= alpha:
+        return alpha
+
+    # Early exit for deep quiescence
+    if q_depth >= 2:
+        return stand_pat
+
+    # Generate and process captures
+    moves = get_captures(board, board.current_player)
+    moves = order_captures(board, moves, board.current_player)
+    
+    for move in moves:
+        board.make_move(move, board.current_player)
+        score = -quiesce(board, -beta, -alpha, board.current_player, q_depth + 1)
+        board.undo_move()
+        
+        if score >= beta:
+            return beta
+        if score > alpha:
+            alpha = score
+
+    return alpha
+
+
+# ---------------------------
+# Selective search: late move reductions, futility pruning and razoring. Only
+# quiet single pushes of pawns that are not passed are reduced or pruned, and
+# nothing is when a pawn is two steps from promotion or en passant is pending.
+LMR_ENABLED = True
+FUTILITY_ENABLED = True
+RAZORING_ENABLED = True
+LMR_MIN_DEPTH = 3
+LMR_MIN_MOVES = 3
+FUTILITY_MARGINS = (0, 150, 300)  # evaluate_board units by remaining depth
+RAZOR_MARGINS = (0, 250, 450)
+PROMOTION_THREAT_WHITE = 0x0000000000FFFF00  # white pawns on ranks 6-7
+PROMOTION_THREAT_BLACK = 0x00FFFF0000000000  # black pawns on ranks 3-2
+search_reductions = 0
+search_futility_prunes = 0
+search_razor_cuts = 0
+
+# Pawn races decided by Eval_bit.pawn_race end the search at that node.
+RACE_CUTOFFS = True
+search_race_cutoffs = 0
+
+# Pawn-only endgame tablebase (TB_bit.py, generated with `python TB_bit.py`):
+# memory-mapped read-only, so Lazy SMP helpers share its pages. None without the file.
+TABLEBASE = open_tablebase()
+search_tb_hits = 0
+search_mirror_skips = 0
+
+
+def tt_key(board):
+    """(key, mirrored) for TRANSPOSITION_TABLE; mirrored moves must be flipped with mirror_move."""
+    if CANONICAL_KEYS:
+        return board.canonical_key()
+    return board.zobrist_hash, False
+
+
+def is_calm(board):
+    """No promotion threat and no en passant capture pending: selective search is allowed."""
+    return not (board.en_passant_target or board.white_pawns & PROMOTION_THREAT_WHITE
+                or board.black_pawns & PROMOTION_THREAT_BLACK)
+
+
+def is_quiet_push(board, move, player_color):
+    """A single push of a pawn that is not passed after the move."""
+    if move & (MOVE_CAPTURE | MOVE_EN_PASSANT | MOVE_DOUBLE_PUSH):
+        return False
+    end = (move >> 6) & 0x3F
+    if player_color == "W":
+        return bool(board.black_pawns & WHITE_FRONT_SPAN[end])
+    return bool(board.white_pawns & BLACK_FRONT_SPAN[end])
+
+
+# ---------------------------
+# Principal Variation Search (negamax) with Quiescence
+def pvs(board, depth, alpha, beta, ply=0):
+    """
+    Scores are from the side to move's point of view. The first move gets the
+    full window; later moves are scouted with a null window (alpha, alpha + 1)
+    and searched again with the full window only when the scout fails high.
+    """
+    global search_nodes, search_scout_researches, search_reductions, search_futility_prunes, search_razor_cuts
+    global search_race_cutoffs, search_tb_hits, search_mirror_skips, search_tt_probes, search_tt_hits
+    search_nodes += 1
+    if not search_nodes & NODE_CHECK_MASK:
+        check_abort()
+    key, mirrored = tt_key(board)
+    entry = TRANSPOSITION_TABLE.probe(key)
+    search_tt_probes += 1
+    if entry is not None:
+        search_tt_hits += 1
+        search_tt_flag_hits[entry[2]] += 1
+    tt_move = entry[3] if entry is not None else None
+    # Leaves (depth 0) are not written to the TT when quiescence has its own cache.
+    store_leaf = depth or not QCACHE_ENABLED
+    if tt_move is not None and mirrored:
+        tt_move = mirror_move(tt_move)
+    # The root has to return a move: race, tablebase and game-over entries carry none.
+    if entry is not None and entry[0] >= depth and (ply or tt_move is not None):
+        tt_score, tt_flag = entry[1], entry[2]
+        if tt_flag == HASH_EXACT:
+            return tt_score, tt_move
+        elif tt_flag == HASH_ALPHA and tt_score <= alpha:
+            return alpha, tt_move
+        elif tt_flag == HASH_BETA and tt_score >= beta:
+            return beta, tt_move
+
+    player_color = board.current_player
+    game_result = board.is_game_over_2(player_color)
+    if game_result is not None:
+        score = CHECKMATE if game_result == player_color else LOSE
+        if store_leaf:
+            TRANSPOSITION_TABLE.store(key, depth, score, HASH_EXACT, None)
+        return score, None
+    # Tablebase and decided pawn races are exact, so cut the subtree (the root still needs a move).
+    if ply and TABLEBASE is not None:
+        result = TABLEBASE.probe(board)
+        if result is not None:
+            win, plies = result
+            search_tb_hits += 1
+            score = CHECKMATE - plies if win else LOSE + plies
+            if store_leaf:
+                TRANSPOSITION_TABLE.store(key, depth, score, HASH_EXACT, None)
+            return score, None
+    if ply and RACE_CUTOFFS:
+        race = pawn_race(board, player_color)
+        if race is not None:
+            winner, moves = race
+            search_race_cutoffs += 1
+            score = CHECKMATE - moves if winner == player_color else LOSE + moves
+            if store_leaf:
+                TRANSPOSITION_TABLE.store(key, depth, score, HASH_EXACT, None)
+            return score, None
+
+    original_alpha = alpha
+    if depth == 0:
+        score = quiesce(board, alpha, beta, player_color)
+        if store_leaf:
+            flag = HASH_ALPHA if score <= original_alpha else HASH_BETA if score >= beta else HASH_EXACT
+            TRANSPOSITION_TABLE.store(key, 0, score, flag, None)
+        return score, None
+
+    calm = is_calm(board)
+    futility_value = None
+    if calm and depth <= 2 and beta - alpha == 1 and (FUTILITY_ENABLED or RAZORING_ENABLED):
+        static_eval = evaluate_board(board, player_color)
+        # Razoring: far below alpha at a frontier node, trust a capture search that confirms it.
+        if RAZORING_ENABLED and static_eval + RAZOR_MARGINS[depth] <= alpha:
+            score = quiesce(board, alpha, alpha + 1, player_color)
+            if score <= alpha:
+                search_razor_cuts += 1
+                return score, None
+        # Futility: quiet pushes cannot lift the score above alpha here.
+        if FUTILITY_ENABLED and static_eval + FUTILITY_MARGINS[depth] <= alpha:
+            futility_value = static_eval + FUTILITY_MARGINS[depth]
+
+    moves = get_all_moves(board, player_color)
+    # A symmetric root: a move and its mirror score the same, search one of them.
+    if not ply and board.is_symmetric():
+        unique = [move for move in moves if mirror_move(move) >= move or mirror_move(move) not in moves]
+        search_mirror_skips += len(moves) - len(unique)
+        moves = unique
+    moves = order_moves(board, moves, player_color, tt_move, ply)
+    best_score = LOSE - 1
+    best_move = None
+    for index, move in enumerate(moves):
+        quiet = calm and index > 0 and is_quiet_push(board, move, player_color)
+        if quiet and futility_value is not None:
+            search_futility_prunes += 1
+            best_score = max(best_score, futility_value)
+            continue
+        board.make_move(move, player_color)
+        if index == 0:
+            score = -pvs(board, depth - 1, -beta, -alpha, ply + 1)[0]
+        else:
+            reduction = 0
+            # Late quiet moves at non-PV (null-window) nodes are searched shallower first.
+            if quiet and LMR_ENABLED and beta - alpha == 1 and depth >= LMR_MIN_DEPTH and index >= LMR_MIN_MOVES:
+                reduction = 2 if depth >= 6 and index >= 6 else 1
+                search_reductions += 1
+            score = -pvs(board, depth - 1 - reduction, -alpha - 1, -alpha, ply + 1)[0]
+            if reduction and score > alpha:
+                score = -pvs(board, depth - 1, -alpha - 1, -alpha, ply + 1)[0]
+            if alpha < score < beta:
+                search_scout_researches += 1
+                score = -pvs(board, depth - 1, -beta, -alpha, ply + 1)[0]
+        board.undo_move()
+        if score > best_score:
+            best_score = score
+            best_move = move
+        if score > alpha:
+            alpha = score
+            if alpha >= beta:
+                record_cutoff(move, depth, ply, player_color, index)
+                break
+    flag = HASH_EXACT
+    if best_score <= original_alpha:
+        flag = HASH_ALPHA
+    elif best_score >= beta:
+        flag = HASH_BETA
+    TRANSPOSITION_TABLE.store(key, depth, best_score, flag,
+                              mirror_move(best_move) if mirrored and best_move is not None else best_move)
+    return best_score, best_move
+
+def iterative_deepening_pvs(board, max_depth, player_color, time_limit=100, start_depth=1, on_depth=None,
+                            verbose=True, hard_limit=None, time_manager=None, seed=None, node_limit=None):
+    """
+    time_limit is the soft limit: no new iteration starts once it has passed.
+    hard_limit (seconds, None = off) aborts the running iteration; the move of
+    the last completed depth is returned.
+    time_manager (Time_bit.TimeManager) replaces both limits with budgets from
+    the game clock and decides after every depth whether to go on.
+    on_depth(depth, score, move) is called after every completed iteration.
+    start_depth / verbose let Lazy SMP helpers stagger their iterations quietly.
+    seed (depth, score, move) from an earlier search of this position, e.g. a
+    ponder hit, resumes at depth + 1 with that move as the fallback.
+    node_limit aborts like hard_limit once that many nodes are searched
+    (checked every NODE_CHECK_MASK + 1 nodes).
+    """
+    global search_nodes, search_deadline, search_node_limit, search_cutoffs, search_first_cutoffs, search_scout_researches
+    global search_reductions, search_futility_prunes, search_razor_cuts, search_race_cutoffs, search_tb_hits
+    global search_mirror_skips, search_tt_probes, search_tt_hits, search_qnodes
+    start_time = time.time()
+    if time_manager is not None:
+        time_limit, hard_limit = time_manager.start(board)
+        if verbose:
+            print(f"⏳ Budget: {time_limit:.2f}s (hard {hard_limit:.2f}s)")
+    # Tablebase positions are solved exactly: play the fastest win / slowest loss.
+    if TABLEBASE is not None:
+        result = TABLEBASE.best_move(board)
+        if result is not None:
+            move, win, plies = result
+            if verbose:
+                print(f"📚 Tablebase: {move_to_notation(move)} {'wins' if win else 'loses'} in {plies} plies")
+                if TELEMETRY is not None:
+                    TELEMETRY.emit("search", ply=board.ply, move=move_to_notation(move), tablebase=True,
+                                   win=win, plies=plies)
+            return move
+    search_nodes = search_cutoffs = search_first_cutoffs = search_scout_researches = 0
+    search_reductions = search_futility_prunes = search_razor_cuts = search_race_cutoffs = search_tb_hits = 0
+    search_mirror_skips = search_tt_probes = search_tt_hits = search_qnodes = 0
+    search_tt_flag_hits[:] = (0, 0, 0)
+    QUIESCENCE_CACHE.probes = QUIESCENCE_CACHE.hits = 0
+    if Eval_bit.EVAL_CACHE is not None:
+        Eval_bit.EVAL_CACHE.probes = Eval_bit.EVAL_CACHE.hits = 0
+    age_heuristics(new_move=True)
+    search_deadline = start_time + hard_limit if hard_limit is not None else float("inf")
+    search_node_limit = node_limit if node_limit is not None else float("inf")
+    root_ply = board.ply
+    best_move = None
+    previous_score = 0
+    aspiration_window = 150  # Optimized for pawn-based evaluation scale
+    research_count = 0
+    completed_depth = 0
+    if seed is not None:
+        completed_depth, previous_score, best_move = seed
+        start_depth = max(start_depth, completed_depth + 1)
+    # Only searches that print report telemetry (not Lazy SMP helpers or the ponder thread).
+    telemetry = TELEMETRY if verbose else None
+    iteration_start = start_time
+    iteration_base = previous_iteration_nodes = 0
+
+    for depth in range(start_depth, max_depth + 1):
+        elapsed = time.time() - start_time
+        if elapsed >= time_limit:
+            break
+
+        try:
+            # Aspiration window logic
+            if depth >= 5:
+                # Use previous score to set narrow window
+                alpha = previous_score - aspiration_window
+                beta = previous_score + aspiration_window
+                eval_score, move = pvs(board, depth, alpha, beta)
+
+                # Check if we need to research with full window
+                if eval_score <= alpha or eval_score >= beta:
+                    research_count += 1
+                    if verbose:
+                        print(f"⚠️  Researching depth {depth} with full window")
+                    eval_score, move = pvs(board, depth, -INFINITY, INFINITY)
+            else:
+                # Full window for early depths
+                eval_score, move = pvs(board, depth, -INFINITY, INFINITY)
+        except SearchAborted:
+            board.undo_to(root_ply)
+            if verbose:
+                print(f"⏱️  Depth {depth} aborted after {time.time() - start_time:.2f}s")
+            break
+        completed_depth = depth
+        age_heuristics()
+        if telemetry is not None:
+            now = time.time()
+            iteration_nodes = search_nodes - iteration_base
+            telemetry.emit("iteration", depth=depth, score=eval_score, move=move and move_to_notation(move),
+                           depth_nodes=iteration_nodes, depth_time=round(now - iteration_start, 4),
+                           branching_factor=(round(iteration_nodes / previous_iteration_nodes, 2)
+                                             if previous_iteration_nodes else None),
+                           aspiration_researches=research_count, **search_stats(now - start_time))
+            previous_iteration_nodes = iteration_nodes
+            iteration_base = search_nodes
+            iteration_start = now
+
+        # Update tracking variables
+        if move:
+            best_move = move
+            previous_score = eval_score
+            if on_depth is not None:
+                on_depth(depth, eval_score, move)
+            if verbose:
+                print(f"🔍 Depth {depth} | Eval: {eval_score} | Move: {move_to_notation(move)}")
+
+        # Check for immediate termination conditions
+        if eval_score >= CHECKMATE - 1000 or eval_score <= LOSE + 1000:
+            if verbose:
+                print(f"🏆 Checkmate found at depth {depth}")
+            break
+        if time_manager is not None and time_manager.should_stop(depth, eval_score, move, time.time() - start_time):
+            break
+
+    # Fallback to random move if no legal moves found
+    if best_move is None:
+        if verbose:
+            print("⚠️  No legal moves found, using fallback")
+        fallback_moves = get_all_moves(board, player_color)
+        best_move = random.choice(fallback_moves) if fallback_moves else None
+
+    if telemetry is not None:
+        telemetry.emit("search", ply=board.ply, move=best_move and move_to_notation(best_move), depth=completed_depth,
+                       aspiration_researches=research_count, **search_stats(time.time() - start_time))
+    if verbose:
+        elapsed = time.time() - start_time
+        print(f"✅ Search completed! Reached depth {completed_depth} | Researches: {research_count} | "
+              f"Scout re-searches: {search_scout_researches} | "
+              f"Nodes: {search_nodes} ({search_nodes / max(elapsed, 1e-9):,.0f}/s) | "
+              f"First-move cutoffs: {first_move_cutoff_rate():.1f}% | Reductions: {search_reductions} | "
+              f"Futility: {search_futility_prunes} | Razor: {search_razor_cuts} | "
+              f"Races: {search_race_cutoffs} | Tablebase: {search_tb_hits} | "
+              f"Mirrored root moves skipped: {search_mirror_skips} | "
+              f"TT hits: {percent(search_tt_hits, search_tt_probes):.1f}% of {search_tt_probes} | "
+              f"Quiescence cache hits: {percent(QUIESCENCE_CACHE.hits, QUIESCENCE_CACHE.probes):.1f}% "
+              f"of {QUIESCENCE_CACHE.probes}")
+        if Eval_bit.EVAL_CACHE is not None:
+            print(f"   Eval cache hits: {Eval_bit.EVAL_CACHE.hit_rate():.1f}% of {Eval_bit.EVAL_CACHE.probes}")
+    return best_move
+
+
+# ---------------------------
+# Lazy SMP: helper processes search the same position at staggered depths and
+# share TRANSPOSITION_TABLE through shared memory; the deepest completed
+# iteration of any process wins.
+def smp_worker(helper_id, table_name, stop_name, size_mb, tasks, results):
+    global TRANSPOSITION_TABLE, SEARCH_STOP
+    TRANSPOSITION_TABLE, table_block = attach_shared_table(table_name, size_mb)
+    stop_block = shared_memory.SharedMemory(name=stop_name)
+    SEARCH_STOP = stop_block.buf
+    board = ChessBoardChessBoard_Bit()
+    # Odd helpers run one iteration ahead of the main process.
+    start_depth = 1 + helper_id % 2
+
+    def report(depth, score, move):
+        results.put((helper_id, depth, score, move))
+
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        state, max_depth, player_color, generation = task
+        board.restore(state)
+        TRANSPOSITION_TABLE.generation = generation
+        # Returns once SEARCH_STOP aborts the running iteration.
+        iterative_deepening_pvs(board, max_depth, player_color, float("inf"), start_depth, report, False)
+        results.put((helper_id, None, None, None))
+
+    SEARCH_STOP = bytearray(1)
+    TRANSPOSITION_TABLE.release()
+    table_block.close()
+    stop_block.close()
+
+
+class LazySMP:
+    """Runs iterative_deepening_pvs in this process plus threads - 1 helper processes."""
+
+    def __init__(self, threads, size_mb=TT_SIZE_MB):
+        global TRANSPOSITION_TABLE
+        self.size_mb = size_mb
+        TRANSPOSITION_TABLE, self.table_block = create_shared_table(size_mb)
+        self.stop_block = shared_memory.SharedMemory(create=True, size=1)
+        self.stop = self.stop_block.buf
+        self.stop[0] = 0
+        self.results = multiprocessing.Queue()
+        self.tasks = []
+        self.helpers = []
+        for helper_id in range(1, threads):
+            tasks = multiprocessing.Queue()
+            helper = multiprocessing.Process(
+                target=smp_worker, daemon=True,
+                args=(helper_id, self.table_block.name, self.stop_block.name, size_mb, tasks, self.results))
+            helper.start()
+            self.tasks.append(tasks)
+            self.helpers.append(helper)
+
+    def search(self, board, max_depth, player_color, time_limit=100, hard_limit=None, time_manager=None, seed=None):
+        state = board.snapshot()
+        for tasks in self.tasks:
+            tasks.put((state, max_depth, player_color, TRANSPOSITION_TABLE.generation))
+
+        completed = []
+        best_move = iterative_deepening_pvs(board, max_depth, player_color, time_limit,
+                                            on_depth=lambda depth, score, move: completed.append((depth, 0, score, move)),
+                                            hard_limit=hard_limit, time_manager=time_manager, seed=seed)
+
+        # Stop the helpers and wait until each has reported, so none is still writing next move.
+        self.stop[0] = 1
+        finished = 0
+        while finished < len(self.helpers):
+            helper_id, depth, score, move = self.results.get()
+            if depth is None:
+                finished += 1
+            else:
+                completed.append((depth, helper_id, score, move))
+        self.stop[0] = 0
+
+        if not completed:
+            return best_move
+        # Deepest iteration wins; the main process breaks ties.
+        depth, helper_id, score, move = max(completed, key=lambda result: (result[0], -result[1]))
+        if helper_id:
+            print(f"🧵 Helper {helper_id} completed depth {depth} | Eval: {score} | Move: {move_to_notation(move)}")
+        return move
+
+    def close(self):
+        global TRANSPOSITION_TABLE
+        for tasks in self.tasks:
+            tasks.put(None)
+        for helper in self.helpers:
+            helper.join()
+        TRANSPOSITION_TABLE.release()
+        TRANSPOSITION_TABLE = TranspositionTable(self.size_mb)
+        self.stop.release()
+        for block in (self.table_block, self.stop_block):
+            block.close()
+            block.unlink()
+
+
+# ---------------------------
+# Pondering: while the opponent thinks, a background thread searches our answer
+# to its most likely reply. A ponder hit hands the completed depth to the real
+# search; a miss only leaves extra entries in the transposition table.
+def predict_reply(board, player_color):
+    """Best move for player_color from the transposition table, else the first ordered move."""
+    moves = get_all_moves(board, player_color)
+    if not moves:
+        return None
+    key, mirrored = tt_key(board)
+    entry = TRANSPOSITION_TABLE.probe(key)
+    if entry is not None and entry[3] is not None:
+        move = mirror_move(entry[3]) if mirrored else entry[3]
+        if move in moves:
+            return move
+    return order_moves(board, moves, player_color)[0]
+
+
+class Ponder:
+    def __init__(self):
+        self.thread = None
+        self.expected = None
+        self.result = None
+        self.hits = self.misses = 0
+
+    def start(self, board, player_color):
+        """Ponder after our move was made on board; player_color is our color."""
+        opponent_color = "B" if player_color == "W" else "W"
+        # is_game_over also sees a game our own move ended by promotion.
+        if board.is_game_over(player_color) is not None:
+            return
+        self.expected = predict_reply(board, opponent_color)
+        if self.expected is None:
+            return
+        ponder_board = ChessBoardChessBoard_Bit()
+        ponder_board.restore(board.snapshot())
+        ponder_board.make_move(self.expected, opponent_color)
+        self.result = None
+        print(f"💭 Pondering on {move_to_notation(self.expected)}")
+        self.thread = threading.Thread(target=self._run, args=(ponder_board, player_color), daemon=True)
+        self.thread.start()
+
+    def _run(self, board, player_color):
+        def record(depth, score, move):
+            self.result = (depth, score, move)
+        iterative_deepening_pvs(board, MAX_SEARCH_DEPTH, player_color, float("inf"), on_depth=record, verbose=False)
+
+    def stop(self, opponent_move):
+        """Stop pondering; returns the (depth, score, move) seed on a ponder hit, else None."""
+        if self.thread is None:
+            return None
+        SEARCH_STOP[0] = 1
+        self.thread.join()
+        SEARCH_STOP[0] = 0
+        self.thread = None
+        if opponent_move is None:
+            return None
+        if opponent_move == self.expected and self.result is not None:
+            self.hits += 1
+            print(f"🎯 Ponder hit ({self.hits}/{self.hits + self.misses}) | depth {self.result[0]} done")
+            return self.result
+        self.misses += 1
+        print(f"❌ Ponder miss ({self.hits}/{self.hits + self.misses})")
+        return None
@@ -0,0 +1,244 @@
+from Board_bit import PRECOMPUTED_ROW_COL, FILE_A, FILE_H, NOT_FILE_A, NOT_FILE_H, FULL_MASK, ROW_2, ROW_5
+
+# Per-square masks: the files next to a square's file, and the square's own row.
+ADJACENT_FILES = [((FILE_A << (col - 1)) if col > 0 else 0) | ((FILE_A << (col + 1)) if col < 7 else 0)
+                  for _, col in PRECOMPUTED_ROW_COL]
+ROW_MASKS = [0xFF << (row * 8) for row, _ in PRECOMPUTED_ROW_COL]
+# Front spans: every square ahead of a pawn on its own and the adjacent files
+# (White moves toward row 0). A pawn is passed when no enemy pawn is in its span.
+WHITE_FRONT_SPAN = [((FILE_A << col) | ADJACENT_FILES[row * 8 + col]) & ((1 << (row * 8)) - 1)
+                    for row, col in PRECOMPUTED_ROW_COL]
+BLACK_FRONT_SPAN = [((FILE_A << col) | ADJACENT_FILES[row * 8 + col]) & (FULL_MASK ^ ((1 << (row * 8 + 8)) - 1))
+                    for row, col in PRECOMPUTED_ROW_COL]
+
+# ---------------------------
+# Pawn races
+# There are no kings: a passed pawn can never be stopped, only out-raced. An
+# enemy pawn changes file only by capturing, so its span is widened by one file
+# per pawn it could take before reaching the passer. With
+# side S to move, S wins once its fastest passer needs no more moves than the
+# opponent's fastest pawn of any kind (S moves first), and loses once the
+# opponent's fastest passer is strictly faster than every pawn of S. Pawns on
+# their starting row count the double push.
+RACE_WIN = 10000  # evaluate_board score of a proven race, less the winner's moves to promote
+
+
+def _white_moves_to_promote(pawns):
+    row = (pawns & -pawns).bit_length() - 1 >> 3
+    return row - 1 if row == 6 else row
+
+
+def _black_moves_to_promote(pawns):
+    row = pawns.bit_length() - 1 >> 3
+    return 6 - row if row == 1 else 7 - row
+
+
+def pawn_race(board, player_color):
+    """
+    Static race solver with player_color to move. Returns (winner, moves) when
+    the race is decided, moves being the winner's moves to promote, else None.
+    """
+    wp = board.white_pawns
+    bp = board.black_pawns
+    # A pending en passant capture can take a pawn that looks passed.
+    if not wp or not bp or board.en_passant_target:
+        return None
+    # Squares strictly ahead of each side's pawns, on every file they can attack:
+    # the adjacent files plus one more per capture (the passer itself excluded).
+    black_ahead = (bp << 8) & FULL_MASK
+    black_ahead |= (black_ahead << 8) & FULL_MASK
+    black_ahead |= (black_ahead << 16) & FULL_MASK
+    black_ahead |= (black_ahead << 32) & FULL_MASK
+    for _ in range(wp.bit_count()):
+        black_ahead |= ((black_ahead & NOT_FILE_H) << 1) | ((black_ahead & NOT_FILE_A) >> 1)
+    white_ahead = wp >> 8
+    white_ahead |= white_ahead >> 8
+    white_ahead |= white_ahead >> 16
+    white_ahead |= white_ahead >> 32
+    for _ in range(bp.bit_count()):
+        white_ahead |= ((white_ahead & NOT_FILE_H) << 1) | ((white_ahead & NOT_FILE_A) >> 1)
+    passed_w = wp & ~black_ahead
+    passed_b = bp & ~white_ahead
+    if not (passed_w or passed_b):
+        return None
+    white_fastest = _white_moves_to_promote(wp)
+    black_fastest = _black_moves_to_promote(bp)
+    white_race = _white_moves_to_promote(passed_w) if passed_w else None
+    black_race = _black_moves_to_promote(passed_b) if passed_b else None
+    if player_color == "W":
+        if white_race is not None and white_race <= black_fastest:
+            return "W", white_race
+        if black_race is not None and black_race < white_fastest:
+            return "B", black_race
+    else:
+        if black_race is not None and black_race <= white_fastest:
+            return "B", black_race
+        if white_race is not None and white_race < black_fastest:
+            return "W", white_race
+    return None
+
+
+# ---------------------------
+# Evaluation cache
+# evaluate_board depends only on the pawns, the en passant target and the side
+# to move, which is exactly what the Zobrist hash covers, and the same
+# structures recur all over the search tree. Direct-mapped, always-replace;
+# keyed by the canonical (file-mirror) key since every term is mirror symmetric.
+# fast_eval is two popcounts, cheaper than a probe, so it is not cached.
+EVAL_CACHE_SIZE_MB = 8
+EVAL_CACHE_ENTRY_BYTES = 8 + 8  # key, score
+
+
+class EvalCache:
+    def __init__(self, size_mb=EVAL_CACHE_SIZE_MB):
+        slots = 1
+        while slots * 2 * EVAL_CACHE_ENTRY_BYTES <= size_mb * 1024 * 1024:
+            slots *= 2
+        self.mask = slots - 1
+        self.keys = memoryview(bytearray(8 * slots)).cast('Q')
+        self.scores = memoryview(bytearray(8 * slots)).cast('q')
+        self.probes = self.hits = 0
+
+    def clear(self):
+        self.keys[:] = memoryview(bytearray(8 * len(self.keys))).cast('Q')
+        self.probes = self.hits = 0
+
+    def hit_rate(self):
+        return 100.0 * self.hits / self.probes if self.probes else 0.0
+
+
+# None turns the cache off.
+EVAL_CACHE = EvalCache()
+
+
+# ---------------------------
+# Evaluation shared by the bitboard engines (Engine_bit.py, Qusince.py)
+
+def evaluate_board(board, player_color):
+    """
+    Evaluate a pawn-only chess position. 
+    Positive score favors White, negative favors Black.
+    
+    Components:
+      - Material (each pawn worth 100 points)
+      - Pawn advancement (reward pawns closer to promotion)
+      - Passed pawns (bonus for passed pawns, heavier weight)
+      - Blocked pawns (penalty for blocked pawns)
+      - Hanging pawns (penalty for pawns vulnerable to capture)
+      - En passant vulnerability (penalty if a pawn is en passant vulnerable)
+      - Pawn connectivity (penalize isolated pawns)
+    A race decided by pawn_race (player_color to move) scores +/-RACE_WIN instead.
+    Results for the side to move are kept in EVAL_CACHE.
+    """
+    cache = EVAL_CACHE
+    if cache is None or player_color != board.current_player:
+        return _evaluate(board, player_color)
+    key = board.canonical_key()[0]
+    index = key & cache.mask
+    cache.probes += 1
+    if cache.keys[index] == key:
+        cache.hits += 1
+        return cache.scores[index]
+    score = _evaluate(board, player_color)
+    cache.keys[index] = key
+    cache.scores[index] = score
+    return score
+
+
+def _evaluate(board, player_color):
+    race = pawn_race(board, player_color)
+    if race is not None:
+        winner, moves = race
+        return RACE_WIN - moves if winner == player_color else moves - RACE_WIN
+
+    # Material and pawn advancement are kept incrementally by make_move/undo_move
+    # (board.psqt_score, White's point of view); only structural terms are computed here.
+    white_score = 0
+    black_score = 0
+    wp = board.white_pawns
+    bp = board.black_pawns
+
+    # --- Passed Pawns ---
+    # For White: calculate squares in front of black pawns.
+    black_front = bp
+    black_front |= (black_front >> 8)
+    black_front |= (black_front >> 16)
+    black_front |= (black_front >> 32)
+    black_front &= FULL_MASK
+    # Include adjacent files.
+    black_front |= ((black_front & ~FILE_H) << 1)
+    black_front |= ((black_front & ~FILE_A) >> 1)
+    black_front &= FULL_MASK
+    passed_wp = wp & ~black_front
+    white_score += 50 * passed_wp.bit_count()  # increased weight from 25 to 50
+
+    # For Black: calculate squares in front of white pawns.
+    white_front = wp
+    white_front |= (white_front << 8)
+    white_front |= (white_front << 16)
+    white_front |= (white_front << 32)
+    white_front &= FULL_MASK
+    white_front |= ((white_front & ~FILE_H) << 1)
+    white_front |= ((white_front & ~FILE_A) >> 1)
+    white_front &= FULL_MASK
+    passed_bp = bp & ~white_front
+    black_score += 50 * passed_bp.bit_count()
+
+    # --- Blocked Pawns ---
+    # A pawn is blocked if an enemy pawn is directly in front.
+    white_blocked = ((wp << 8) & bp).bit_count()
+    black_blocked = ((bp >> 8) & wp).bit_count()
+    white_score -= 10 * white_blocked  # reduced penalty from 15 to 10
+    black_score -= 10 * black_blocked
+
+    # --- Hanging Pawns ---
+    # A pawn is hanging if an enemy pawn sits on one of the two diagonal squares in front of it.
+    white_hanging = wp & ((((bp & NOT_FILE_H) << 9) | ((bp & NOT_FILE_A) << 7)) & FULL_MASK)
+    black_hanging = bp & (((wp & NOT_FILE_H) >> 7) | ((wp & NOT_FILE_A) >> 9))
+    white_score -= 40 * white_hanging.bit_count()  # reduced penalty from 50 to 40
+    black_score -= 40 * black_hanging.bit_count()
+
+    # --- En Passant Vulnerability ---
+    # Only the pawn directly behind the en passant target can be affected.
+    ep = board.en_passant_target
+    if ep:
+        ep_pos = ep.bit_length() - 1
+        if ep & ROW_2:
+            pos = ep_pos + 8
+            if (wp >> pos) & 1 and bp & ADJACENT_FILES[pos] & ROW_MASKS[pos]:
+                white_score -= 40  # reduced penalty from 50 to 40
+        elif ep & ROW_5:
+            pos = ep_pos - 8
+            if (bp >> pos) & 1 and wp & ADJACENT_FILES[pos] & ROW_MASKS[pos]:
+                black_score -= 40
+
+    # --- Pawn Connectivity (Isolated Pawn Penalty) ---
+    # Collapse each side onto a byte of occupied files, then spread the neighbours back to full files.
+    white_files = wp | (wp >> 32)
+    white_files |= white_files >> 16
+    white_files = (white_files | (white_files >> 8)) & 0xFF
+    black_files = bp | (bp >> 32)
+    black_files |= black_files >> 16
+    black_files = (black_files | (black_files >> 8)) & 0xFF
+    white_neighbours = (((white_files << 1) | (white_files >> 1)) & 0xFF) * FILE_A
+    black_neighbours = (((black_files << 1) | (black_files >> 1)) & 0xFF) * FILE_A
+    isolated_w = (wp & ~white_neighbours).bit_count()
+    isolated_b = (bp & ~black_neighbours).bit_count()
+
+    white_score -= 20 * isolated_w
+    black_score -= 20 * isolated_b
+
+    # --- Mobility (Optional) ---
+    # (We could add a mobility component here; omitted for brevity.)
+
+    score = board.psqt_score + white_score - black_score
+    return score if player_color == "W" else -score
+
+
+def fast_eval(board, player_color):
+    """Material count only (10x faster than bin().count())"""
+    w = board.white_pawns
+    b = board.black_pawns
+    white_count = ((w & 0xAAAAAAAAAAAAAAAA) >> 1).bit_count() + (w & 0x5555555555555555).bit_count()
+    black_count = ((b & 0xAAAAAAAAAAAAAAAA) >> 1).bit_count() + (b & 0x5555555555555555).bit_count()
+    return (white_count - black_count) * 10 if player_color == "W" else (black_count - white_count) * 10
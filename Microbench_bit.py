@@ -0,0 +1,1079 @@
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+from Board_bit import (ChessBoardChessBoard_Bit, get_all_moves, move_to_tuple, move_to_notation, mirror_files, mirror_move, LSB_INDEX_TABLE,
+                       PRECOMPUTED_ROW_COL, MOVE_CAPTURE, MOVE_DOUBLE_PUSH, MOVE_EN_PASSANT, FILE_A, FILE_H, FULL_MASK,
+                       zobrist_white, zobrist_black, zobrist_en_passant, zobrist_current_player, zobrist_white_mirror,
+                       zobrist_black_mirror, zobrist_en_passant_mirror, WHITE_PSQT, BLACK_PSQT)
+import Eval_bit
+from Eval_bit import evaluate_board, pawn_race, EvalCache
+from TT_bit import TranspositionTable, HASH_EXACT, HASH_ALPHA, HASH_BETA
+from TB_bit import generate, open_tablebase, TB_PATH
+
+# Positions used by every micro-benchmark below.
+POSITIONS = [
+    "Setup Wa2 Wb2 Wc2 Wd2 We2 Wf2 Wg2 Wh2 Ba7 Bb7 Bc7 Bd7 Be7 Bf7 Bg7 Bh7",
+    "Setup Wa2 Wb3 Wc4 We2 Wf2 Wh4 Ba7 Bb5 Bd7 Be5 Bf7 Bg6",
+    "Setup Wa4 Wc5 Wd2 We4 Wg2 Bb7 Bc7 Bd5 Bf7 Bg7 Bh5",
+    "Setup Wb5 Wd5 Wf2 Wh2 Ba7 Bc7 Be7 Bg7",
+]
+
+
+# ---------------------------
+# Reference per-pawn generator (the loop every engine used before the set-wise version)
+def legacy_get_all_moves(board, player_color):
+    moves = []
+    if player_color == "W":
+        pawns = board.white_pawns
+        opponent_pawns = board.black_pawns
+        direction = -1
+    else:
+        pawns = board.black_pawns
+        opponent_pawns = board.white_pawns
+        direction = 1
+    all_pawns = board.white_pawns | board.black_pawns
+
+    while pawns:
+        lsb_val = pawns & -pawns
+        pos = LSB_INDEX_TABLE[lsb_val]
+        row, col = PRECOMPUTED_ROW_COL[pos]
+        pawns ^= lsb_val
+
+        if 0 <= row + direction < 8:
+            forward = pos + (direction * 8)
+            if not (all_pawns & (1 << forward)):
+                moves.append(((row, col), (row + direction, col)))
+        if (player_color == "W" and row == 6) or (player_color == "B" and row == 1):
+            double_forward = pos + (2 * direction * 8)
+            if not (all_pawns & (1 << double_forward)) and not (all_pawns & (1 << (pos + direction * 8))):
+                moves.append(((row, col), (row + 2 * direction, col)))
+        for dc in [-1, 1]:
+            if 0 <= col + dc < 8 and 0 <= row + direction < 8:
+                capture_pos = pos + direction * 8 + dc
+                if opponent_pawns & (1 << capture_pos):
+                    moves.append(((row, col), (row + direction, col + dc)))
+        if board.en_passant_target:
+            ep_pos = board.en_passant_target.bit_length() - 1
+            ep_row, ep_col = divmod(ep_pos, 8)
+            if (player_color == "W" and row == 3 and ep_row == 2) or (player_color == "B" and row == 4 and ep_row == 5):
+                if abs(col - ep_col) == 1:
+                    moves.append(((row, col), (ep_row, ep_col)))
+    return moves
+
+
+# Reference dict-snapshot make/undo (what make_move did before the undo stack)
+def legacy_make_move(board, move, player_color):
+    stored_info = {
+        "white_pawns": board.white_pawns,
+        "black_pawns": board.black_pawns,
+        "en_passant_target": board.en_passant_target,
+        "last_move": board.last_move,
+        "current_player": board.current_player,
+        "zobrist_hash": board.zobrist_hash,
+        "psqt_score": board.psqt_score,
+        "mirror_hash": board.mirror_hash,
+    }
+    start = move & 0x3F
+    end = (move >> 6) & 0x3F
+    move_bits = (1 << start) | (1 << end)
+    if player_color == 'W':
+        board.white_pawns ^= move_bits
+        board.zobrist_hash ^= zobrist_white[start] ^ zobrist_white[end]
+        board.mirror_hash ^= zobrist_white_mirror[start] ^ zobrist_white_mirror[end]
+        board.psqt_score += WHITE_PSQT[end] - WHITE_PSQT[start]
+        if move & MOVE_CAPTURE:
+            board.black_pawns ^= 1 << end
+            board.zobrist_hash ^= zobrist_black[end]
+            board.mirror_hash ^= zobrist_black_mirror[end]
+            board.psqt_score += BLACK_PSQT[end]
+        elif move & MOVE_EN_PASSANT:
+            board.black_pawns ^= 1 << (end + 8)
+            board.zobrist_hash ^= zobrist_black[end + 8]
+            board.mirror_hash ^= zobrist_black_mirror[end + 8]
+            board.psqt_score += BLACK_PSQT[end + 8]
+    else:
+        board.black_pawns ^= move_bits
+        board.zobrist_hash ^= zobrist_black[start] ^ zobrist_black[end]
+        board.mirror_hash ^= zobrist_black_mirror[start] ^ zobrist_black_mirror[end]
+        board.psqt_score -= BLACK_PSQT[end] - BLACK_PSQT[start]
+        if move & MOVE_CAPTURE:
+            board.white_pawns ^= 1 << end
+            board.zobrist_hash ^= zobrist_white[end]
+            board.mirror_hash ^= zobrist_white_mirror[end]
+            board.psqt_score -= WHITE_PSQT[end]
+        elif move & MOVE_EN_PASSANT:
+            board.white_pawns ^= 1 << (end - 8)
+            board.zobrist_hash ^= zobrist_white[end - 8]
+            board.mirror_hash ^= zobrist_white_mirror[end - 8]
+            board.psqt_score -= WHITE_PSQT[end - 8]
+    if board.en_passant_target:
+        ep = board.en_passant_target.bit_length() - 1
+        board.zobrist_hash ^= zobrist_en_passant[ep]
+        board.mirror_hash ^= zobrist_en_passant_mirror[ep]
+    if move & MOVE_DOUBLE_PUSH:
+        mid = (start + end) >> 1
+        board.en_passant_target = 1 << mid
+        board.zobrist_hash ^= zobrist_en_passant[mid]
+        board.mirror_hash ^= zobrist_en_passant_mirror[mid]
+    else:
+        board.en_passant_target = None
+    side = zobrist_current_player[0] ^ zobrist_current_player[1]
+    board.zobrist_hash ^= side
+    board.mirror_hash ^= side
+    board.current_player = 'B' if board.current_player == 'W' else 'W'
+    board.last_move = move
+    return stored_info
+
+
+def legacy_undo_move(board, stored_info):
+    board.white_pawns = stored_info["white_pawns"]
+    board.black_pawns = stored_info["black_pawns"]
+    board.en_passant_target = stored_info["en_passant_target"]
+    board.last_move = stored_info["last_move"]
+    board.current_player = stored_info["current_player"]
+    board.zobrist_hash = stored_info["zobrist_hash"]
+    board.psqt_score = stored_info["psqt_score"]
+    board.mirror_hash = stored_info["mirror_hash"]
+
+
+# Reference evaluator: evaluate_board as it was before material/advancement became incremental
+def legacy_evaluate_board(board, player_color):
+    white_score = 0
+    black_score = 0
+    wp = board.white_pawns
+    bp = board.black_pawns
+
+    # --- Material Advantage ---
+    white_count = wp.bit_count()
+    black_count = bp.bit_count()
+    white_score += 100 * white_count
+    black_score += 100 * black_count
+
+    # --- Pawn Advancement ---
+    # For white, bonus increases as pawn advances upward (row 0 is promotion)
+    # For black, bonus increases as pawn advances downward (row 7 is promotion)
+    temp_wp = wp
+    while temp_wp:
+        lsb = temp_wp & -temp_wp
+        pos = LSB_INDEX_TABLE[lsb]
+        row, col = PRECOMPUTED_ROW_COL[pos]
+        # White pawn: bonus = 3 points for each rank advanced (max bonus 3*7 = 21)
+        white_score += 3 * (7 - row)
+        temp_wp ^= lsb
+
+    temp_bp = bp
+    while temp_bp:
+        lsb = temp_bp & -temp_bp
+        pos = LSB_INDEX_TABLE[lsb]
+        row, col = PRECOMPUTED_ROW_COL[pos]
+        # Black pawn: bonus = 3 points for each rank advanced (max bonus 3*7 = 21)
+        black_score += 3 * row
+        temp_bp ^= lsb
+
+    # --- Passed Pawns ---
+    # For White: calculate squares in front of black pawns.
+    black_front = bp
+    black_front |= (black_front >> 8)
+    black_front |= (black_front >> 16)
+    black_front |= (black_front >> 32)
+    black_front &= FULL_MASK
+    # Include adjacent files.
+    black_front |= ((black_front & ~FILE_H) << 1)
+    black_front |= ((black_front & ~FILE_A) >> 1)
+    black_front &= FULL_MASK
+    passed_wp = wp & ~black_front
+    white_score += 50 * passed_wp.bit_count()  # increased weight from 25 to 50
+
+    # For Black: calculate squares in front of white pawns.
+    white_front = wp
+    white_front |= (white_front << 8)
+    white_front |= (white_front << 16)
+    white_front |= (white_front << 32)
+    white_front &= FULL_MASK
+    white_front |= ((white_front & ~FILE_H) << 1)
+    white_front |= ((white_front & ~FILE_A) >> 1)
+    white_front &= FULL_MASK
+    passed_bp = bp & ~white_front
+    black_score += 50 * passed_bp.bit_count()
+
+    # --- Blocked Pawns ---
+    # A pawn is blocked if an enemy pawn is directly in front.
+    white_blocked = ((wp << 8) & bp).bit_count()
+    black_blocked = ((bp >> 8) & wp).bit_count()
+    white_score -= 10 * white_blocked  # reduced penalty from 15 to 10
+    black_score -= 10 * black_blocked
+
+    # --- Hanging Pawns ---
+    # For White: check if an enemy pawn can capture from one of the two diagonal squares.
+    temp_wp = wp
+    while temp_wp:
+        lsb = temp_wp & -temp_wp
+        pos = LSB_INDEX_TABLE[lsb]
+        row, col = PRECOMPUTED_ROW_COL[pos]
+        direction = -1  # white's capturing direction (upwards)
+        attack_mask = 0
+        if col - 1 >= 0 and 0 <= row + direction < 8:
+            attack_mask |= 1 << ((row + direction) * 8 + (col - 1))
+        if col + 1 < 8 and 0 <= row + direction < 8:
+            attack_mask |= 1 << ((row + direction) * 8 + (col + 1))
+        if board.black_pawns & attack_mask:
+            white_score -= 40  # reduced penalty from 50 to 40
+        temp_wp ^= lsb
+
+    # For Black:
+    temp_bp = bp
+    while temp_bp:
+        lsb = temp_bp & -temp_bp
+        pos = LSB_INDEX_TABLE[lsb]
+        row, col = PRECOMPUTED_ROW_COL[pos]
+        direction = 1  # black's capturing direction (downwards)
+        attack_mask = 0
+        if col - 1 >= 0 and 0 <= row + direction < 8:
+            attack_mask |= 1 << ((row + direction) * 8 + (col - 1))
+        if col + 1 < 8 and 0 <= row + direction < 8:
+            attack_mask |= 1 << ((row + direction) * 8 + (col + 1))
+        if board.white_pawns & attack_mask:
+            black_score -= 40
+        temp_bp ^= lsb
+
+    # --- En Passant Vulnerability ---
+    if board.en_passant_target:
+        ep_pos = board.en_passant_target.bit_length() - 1
+        ep_row, ep_col = divmod(ep_pos, 8)
+        # For White: if a pawn is on row 3 and en passant target is on row 2
+        temp_wp = wp
+        while temp_wp:
+            lsb = temp_wp & -temp_wp
+            pos = LSB_INDEX_TABLE[lsb]
+            row, col = PRECOMPUTED_ROW_COL[pos]
+            if row == 3 and ep_row == 2 and col == ep_col:
+                adjacent = 0
+                if col - 1 >= 0:
+                    adjacent |= 1 << (row * 8 + col - 1)
+                if col + 1 < 8:
+                    adjacent |= 1 << (row * 8 + col + 1)
+                if board.black_pawns & adjacent:
+                    white_score -= 40  # reduced penalty from 50 to 40
+            temp_wp ^= lsb
+
+        # For Black: if a pawn is on row 4 and en passant target is on row 5
+        temp_bp = bp
+        while temp_bp:
+            lsb = temp_bp & -temp_bp
+            pos = LSB_INDEX_TABLE[lsb]
+            row, col = PRECOMPUTED_ROW_COL[pos]
+            if row == 4 and ep_row == 5 and col == ep_col:
+                adjacent = 0
+                if col - 1 >= 0:
+                    adjacent |= 1 << (row * 8 + col - 1)
+                if col + 1 < 8:
+                    adjacent |= 1 << (row * 8 + col + 1)
+                if board.white_pawns & adjacent:
+                    black_score -= 40
+            temp_bp ^= lsb
+
+    # --- Pawn Connectivity (Isolated Pawn Penalty) ---
+    isolated_w = 0
+    temp_wp = wp
+    while temp_wp:
+        i = (temp_wp & -temp_wp).bit_length() - 1
+        temp_wp &= temp_wp - 1
+        file_index = i % 8
+        mask_left = 0x0101010101010101 << (file_index - 1) if file_index > 0 else 0
+        mask_right = 0x0101010101010101 << (file_index + 1) if file_index < 7 else 0
+        if (wp & (mask_left | mask_right)) == 0:
+            isolated_w += 1
+    isolated_b = 0
+    temp_bp = bp
+    while temp_bp:
+        j = (temp_bp & -temp_bp).bit_length() - 1
+        temp_bp &= temp_bp - 1
+        file_index = j % 8
+        mask_left = 0x0101010101010101 << (file_index - 1) if file_index > 0 else 0
+        mask_right = 0x0101010101010101 << (file_index + 1) if file_index < 7 else 0
+        if (bp & (mask_left | mask_right)) == 0:
+            isolated_b += 1
+
+    white_score -= 20 * isolated_w
+    black_score -= 20 * isolated_b
+
+    # --- Mobility (Optional) ---
+    # (We could add a mobility component here; omitted for brevity.)
+
+    return white_score - black_score if player_color == "W" else black_score - white_score
+
+
+def _setup(position):
+    board = ChessBoardChessBoard_Bit()
+    board.initialize_custom_board(position)
+    return board
+
+
+def board_from(board, node):
+    """Load a node recorded by _collect into board."""
+    (board.white_pawns, board.black_pawns, board.en_passant_target,
+     board.current_player, board.zobrist_hash) = node[:5]
+    return board
+
+
+def _collect(board, depth, nodes):
+    """
+    Walk the perft tree, check both generators agree on the move set at every
+    node and record each node's state for the timing runs.
+    """
+    new_moves = get_all_moves(board, board.current_player)
+    old_moves = legacy_get_all_moves(board, board.current_player)
+    unpacked = [move_to_tuple(move) for move in new_moves]
+    if sorted(unpacked) != sorted(old_moves) or len(new_moves) != len(set(new_moves)):
+        board.print_board()
+        raise AssertionError(f"Move sets differ: {sorted(unpacked)} != {sorted(old_moves)}")
+    nodes.append((board.white_pawns, board.black_pawns, board.en_passant_target, board.current_player,
+                  board.zobrist_hash))
+    if depth == 0 or board.is_game_over_2(board.current_player) is not None:
+        return
+    for move in new_moves:
+        board.make_move(move, board.current_player)
+        _collect(board, depth - 1, nodes)
+        board.undo_move()
+
+
+def bench_movegen(depth=4):
+    print("--- Move generation (perft) ---")
+    nodes = []
+    for position in POSITIONS:
+        count = len(nodes)
+        _collect(_setup(position), depth, nodes)
+        print(f"✅ {len(nodes) - count} nodes identical | {position}")
+
+    board = ChessBoardChessBoard_Bit()
+    for name, generator in (("legacy", legacy_get_all_moves), ("set-wise", get_all_moves)):
+        start_time = time.perf_counter()
+        for board.white_pawns, board.black_pawns, board.en_passant_target, color, _ in nodes:
+            generator(board, color)
+        elapsed = time.perf_counter() - start_time
+        print(f"{name:>9}: {len(nodes)} nodes in {elapsed:.3f}s | {len(nodes) / elapsed:,.0f} nodes/sec")
+
+
+def _pairs_legacy(board, nodes):
+    for wp, bp, ep, color, zobrist_hash, moves in nodes:
+        board.white_pawns, board.black_pawns, board.en_passant_target = wp, bp, ep
+        board.current_player, board.zobrist_hash = color, zobrist_hash
+        for move in moves:
+            stored_info = legacy_make_move(board, move, color)
+            legacy_undo_move(board, stored_info)
+
+
+def _pairs_stack(board, nodes):
+    for wp, bp, ep, color, zobrist_hash, moves in nodes:
+        board.white_pawns, board.black_pawns, board.en_passant_target = wp, bp, ep
+        board.current_player, board.zobrist_hash = color, zobrist_hash
+        for move in moves:
+            board.make_move(move, color)
+            board.undo_move()
+
+
+def bench_makemove(depth=3, repeats=20):
+    print("--- make/unmake pairs ---")
+    nodes = []
+    for position in POSITIONS:
+        _collect(_setup(position), depth, nodes)
+    board = ChessBoardChessBoard_Bit()
+    nodes = [node + (get_all_moves(board_from(board, node), node[3]),) for node in nodes]
+    pairs = sum(len(node[5]) for node in nodes)
+
+    for wp, bp, ep, color, zobrist_hash, moves in nodes:
+        for move in moves:
+            board_from(board, (wp, bp, ep, color, zobrist_hash))
+            before = board.snapshot()
+            stored_info = legacy_make_move(board, move, color)
+            reference = board.snapshot()
+            legacy_undo_move(board, stored_info)
+            board.make_move(move, color)
+            if board.snapshot() != reference:
+                raise AssertionError(f"make_move and the dict snapshot baseline disagree after {move}")
+            board.undo_move()
+            if board.snapshot() != before:
+                raise AssertionError(f"undo_move did not restore the position after {move}")
+
+    # Alternate the two implementations and keep the best pass of each to filter out noise.
+    best = {"dict snapshot": float("inf"), "undo stack": float("inf")}
+    for _ in range(repeats):
+        for name, run in (("dict snapshot", _pairs_legacy), ("undo stack", _pairs_stack)):
+            start_time = time.perf_counter()
+            run(board, nodes)
+            best[name] = min(best[name], time.perf_counter() - start_time)
+    for name, elapsed in best.items():
+        print(f"{name:>13}: {pairs} pairs in {elapsed:.3f}s | {pairs / elapsed:,.0f} pairs/sec")
+
+
+def _collect_boards(board, depth, boards):
+    """Copy every position of the perft tree, keeping the incremental scores make_move maintains."""
+    copy = ChessBoardChessBoard_Bit()
+    copy.white_pawns, copy.black_pawns = board.white_pawns, board.black_pawns
+    copy.en_passant_target, copy.current_player = board.en_passant_target, board.current_player
+    copy.zobrist_hash, copy.psqt_score = board.zobrist_hash, board.psqt_score
+    copy.mirror_hash = board.mirror_hash
+    boards.append(copy)
+    if depth == 0 or board.is_game_over_2(board.current_player) is not None:
+        return
+    color = board.current_player
+    for move in get_all_moves(board, color):
+        board.make_move(move, color)
+        _collect_boards(board, depth - 1, boards)
+        board.undo_move()
+
+
+def bench_eval(depth=3, repeats=10):
+    print("--- evaluate_board ---")
+    boards = []
+    for position in POSITIONS:
+        _collect_boards(_setup(position), depth, boards)
+    # Random placements exercise en passant and edge-file cases the trees rarely reach.
+    rng = random.Random(7)
+    for _ in range(2000):
+        board = ChessBoardChessBoard_Bit()
+        squares = rng.sample(range(8, 56), rng.randint(2, 20))
+        split = rng.randint(1, len(squares) - 1)
+        board.white_pawns = sum(1 << square for square in squares[:split])
+        board.black_pawns = sum(1 << square for square in squares[split:])
+        board.en_passant_target = rng.choice([None, 1 << rng.randrange(16, 24), 1 << rng.randrange(40, 48)])
+        board._initialize_psqt_score()
+        board._initialize_zobrist_hash()
+        boards.append(board)
+    # Compare and time the evaluator itself; the cached path is timed separately below.
+    cache = Eval_bit.EVAL_CACHE
+    Eval_bit.EVAL_CACHE = None
+    try:
+        _check_and_time_eval(boards, repeats)
+    finally:
+        Eval_bit.EVAL_CACHE = cache
+
+    # Every pass after the first hits the cache.
+    Eval_bit.EVAL_CACHE = EvalCache()
+    try:
+        best = float("inf")
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            for board in boards:
+                evaluate_board(board, board.current_player)
+            best = min(best, time.perf_counter() - start_time)
+        print(f"{'cached':>9}: {len(boards)} evals in {best:.3f}s | {len(boards) / best:,.0f} evals/sec")
+    finally:
+        Eval_bit.EVAL_CACHE = cache
+
+
+def _check_and_time_eval(boards, repeats):
+    races = 0
+    for board in boards:
+        for color in ("W", "B"):
+            # Decided races score +/-RACE_WIN; the original evaluator had no solver.
+            if pawn_race(board, color) is not None:
+                races += 1
+                continue
+            expected = legacy_evaluate_board(board, color)
+            if evaluate_board(board, color) != expected:
+                board.print_board()
+                raise AssertionError(f"evaluate_board({color}) = {evaluate_board(board, color)}, expected {expected}")
+    print(f"✅ {len(boards)} positions score identically ({races} decided races skipped)")
+
+    best = {"legacy": float("inf"), "Eval_bit": float("inf")}
+    for _ in range(repeats):
+        for name, evaluate in (("legacy", legacy_evaluate_board), ("Eval_bit", evaluate_board)):
+            start_time = time.perf_counter()
+            for board in boards:
+                evaluate(board, "W")
+            best[name] = min(best[name], time.perf_counter() - start_time)
+    for name, elapsed in best.items():
+        print(f"{name:>9}: {len(boards)} evals in {elapsed:.3f}s | {len(boards) / elapsed:,.0f} evals/sec")
+
+
+class DictTable:
+    """Reference table: an unbounded dict with TranspositionTable's interface, keeping the deepest entry per key."""
+
+    def __init__(self):
+        self.entries = {}
+        self.generation = 0
+
+    def new_search(self):
+        pass
+
+    def clear(self):
+        self.entries.clear()
+
+    def probe(self, key):
+        return self.entries.get(key)
+
+    def store(self, key, depth, score, flag, best_move):
+        entry = self.entries.get(key)
+        if entry is None or entry[0] <= depth:
+            self.entries[key] = (depth, score, flag, best_move)
+
+    def hashfull(self):
+        return 0
+
+
+def bench_tt(depth=4, repeats=5, search_depth=7):
+    print("--- transposition table ---")
+    nodes = []
+    for position in POSITIONS:
+        _collect(_setup(position), depth, nodes)
+    rng = random.Random(11)
+    entries = [(node[4], rng.randint(1, 12), rng.randint(-100000, 100000), rng.choice((HASH_EXACT, HASH_ALPHA, HASH_BETA)),
+                rng.choice((None, rng.randrange(1, 1 << 15)))) for node in nodes]
+    table = TranspositionTable(64)
+    latest = {}
+    for key, depth_left, score, flag, move in entries:
+        table.store(key, depth_left, score, flag, move)
+        latest[key] = (depth_left, score, flag, move)
+    # A bucket only drops an entry when a third key lands on it, which 64 MB makes rare here.
+    missing = 0
+    for key, expected in latest.items():
+        found = table.probe(key)
+        if found is None:
+            missing += 1
+        elif found != expected:
+            raise AssertionError(f"probe({key:#x}) = {found}, expected {expected}")
+    print(f"✅ {len(latest)} keys round-trip ({missing} evicted)")
+
+    best = {"dict": float("inf"), "TT_bit": float("inf")}
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        store = {}
+        for key, depth_left, score, flag, move in entries:
+            entry = store.get(key)
+            if entry is None or entry["depth"] <= depth_left:
+                store[key] = {"score": score, "depth": depth_left, "flag": flag, "best_move": move}
+        for key, _, _, _, _ in entries:
+            store.get(key)
+        best["dict"] = min(best["dict"], time.perf_counter() - start_time)
+
+        table.clear()
+        start_time = time.perf_counter()
+        for key, depth_left, score, flag, move in entries:
+            table.store(key, depth_left, score, flag, move)
+        for key, _, _, _, _ in entries:
+            table.probe(key)
+        best["TT_bit"] = min(best["TT_bit"], time.perf_counter() - start_time)
+    for name, elapsed in best.items():
+        print(f"{name:>9}: {2 * len(entries)} store+probe in {elapsed:.3f}s | {2 * len(entries) / elapsed:,.0f} ops/sec")
+    print(f"   TT_bit: {table.slots} slots, fixed {table.slots * 17 / (1024 * 1024):.0f} MB")
+
+    # What the slower lookups cost a real search: the same fixed-depth searches
+    # with the dict as Engine_bit's table.
+    import Engine_bit
+    engine_table = Engine_bit.TRANSPOSITION_TABLE
+    best = {}
+    try:
+        for _ in range(repeats // 2 or 1):
+            for name, search_table in (("dict", DictTable()), ("TT_bit", engine_table)):
+                Engine_bit.TRANSPOSITION_TABLE = search_table
+                total_nodes = total_time = 0
+                for position in POSITIONS:
+                    _, _, nodes, elapsed = _search_fixed_depth(Engine_bit, _setup(position), search_depth)
+                    total_nodes += nodes
+                    total_time += elapsed
+                if name not in best or total_time < best[name][1]:
+                    best[name] = (total_nodes, total_time)
+    finally:
+        Engine_bit.TRANSPOSITION_TABLE = engine_table
+    for name, (total_nodes, total_time) in best.items():
+        print(f"{name:>9}: search depth {search_depth} in {total_nodes} nodes, {total_time:.3f}s | "
+              f"{total_nodes / total_time:,.0f} nodes/sec")
+
+
+def bench_smp(depth=7, max_threads=None):
+    """Time-to-depth of Engine_bit's Lazy SMP search for 1, 2, 4 ... max_threads processes."""
+    import Engine_bit
+
+    print("--- Lazy SMP time-to-depth ---")
+    max_threads = max_threads or os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= max_threads:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_threads:
+        counts.append(max_threads)
+    print(f"depth {depth}, {os.cpu_count()} CPUs")
+    baseline = None
+    for threads in counts:
+        smp = Engine_bit.LazySMP(threads)
+        elapsed = 0.0
+        for position in POSITIONS:
+            board = _setup(position)
+            Engine_bit.TRANSPOSITION_TABLE.clear()
+            start_time = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                smp.search(board, depth, board.current_player, time_limit=float("inf"))
+            elapsed += time.perf_counter() - start_time
+        smp.close()
+        baseline = baseline or elapsed
+        print(f"{threads:>3} threads: {elapsed:.3f}s | speedup {baseline / elapsed:.2f}x")
+
+
+def _search_fixed_depth(engine, board, depth):
+    """Run engine's iterative deepening to depth on a cleared table; returns (move, score, nodes, seconds)."""
+    engine.TRANSPOSITION_TABLE.clear()
+    engine.QUIESCENCE_CACHE.clear()
+    engine.clear_heuristics()
+    scores = {}
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        move = engine.iterative_deepening_pvs(board, depth, board.current_player, time_limit=float("inf"),
+                                              on_depth=lambda d, score, m: scores.__setitem__(d, score))
+    return move, scores.get(depth), engine.search_nodes, time.perf_counter() - start_time
+
+
+def bench_ordering(depth=7):
+    """Nodes and first-move cutoff rate to a fixed depth with the static ordering vs killers/history/TT move."""
+    import Engine_bit
+
+    print("--- move ordering ---")
+    for heuristics in (False, True):
+        Engine_bit.ORDERING_HEURISTICS = heuristics
+        total_nodes = total_time = 0
+        rates = []
+        for position in POSITIONS:
+            move, score, nodes, elapsed = _search_fixed_depth(Engine_bit, _setup(position), depth)
+            total_nodes += nodes
+            total_time += elapsed
+            rates.append(Engine_bit.first_move_cutoff_rate())
+            print(f"  {'heuristics' if heuristics else 'static':>10} | {move_to_notation(move)} {score:>6} | "
+                  f"{nodes:>8} nodes | first-move cutoffs {rates[-1]:.1f}%")
+        print(f"{'heuristics' if heuristics else 'static':>12}: depth {depth} in {total_nodes} nodes, "
+              f"{total_time:.3f}s | mean first-move cutoffs {sum(rates) / len(rates):.1f}%")
+    Engine_bit.ORDERING_HEURISTICS = True
+
+
+def legacy_minimax_pvs(engine, board, depth, alpha, beta, maximizing_player, root_color, ply=0):
+    """
+    Engine_bit.pvs before the negamax rewrite: minimax alpha-beta from
+    root_color's view with the full window for every move. Shares the engine's
+    table keys, ordering, root mirror skip and quiescence, and like pvs keeps
+    leaves out of the table, so only the window handling differs. bench_pvs
+    switches the selective cutoffs off for both.
+    """
+    engine.search_nodes += 1
+    key, mirrored = engine.tt_key(board)
+    entry = engine.TRANSPOSITION_TABLE.probe(key)
+    tt_move = entry[3] if entry is not None else None
+    if tt_move is not None and mirrored:
+        tt_move = mirror_move(tt_move)
+    if entry is not None and entry[0] >= depth and (ply or tt_move is not None):
+        tt_score, tt_flag = entry[1], entry[2]
+        if tt_flag == HASH_EXACT:
+            return tt_score, tt_move
+        elif tt_flag == HASH_ALPHA and tt_score <= alpha:
+            return alpha, tt_move
+        elif tt_flag == HASH_BETA and tt_score >= beta:
+            return beta, tt_move
+
+    store_leaf = depth or not engine.QCACHE_ENABLED
+    game_result = board.is_game_over_2(board.current_player)
+    if game_result is not None:
+        score = engine.CHECKMATE if game_result == root_color else engine.LOSE
+        if store_leaf:
+            engine.TRANSPOSITION_TABLE.store(key, depth, score, HASH_EXACT, None)
+        return score, None
+
+    if depth == 0:
+        if board.current_player == root_color:
+            return engine.quiesce(board, alpha, beta, root_color), None
+        return -engine.quiesce(board, -beta, -alpha, board.current_player), None
+
+    moves = get_all_moves(board, board.current_player)
+    if not ply and board.is_symmetric():
+        moves = [move for move in moves if mirror_move(move) >= move or mirror_move(move) not in moves]
+    moves = engine.order_moves(board, moves, board.current_player, tt_move, ply)
+    original_alpha, original_beta = alpha, beta
+    best_move = None
+    best_score = -engine.INFINITY if maximizing_player else engine.INFINITY
+    for index, move in enumerate(moves):
+        board.make_move(move, board.current_player)
+        eval_score, _ = legacy_minimax_pvs(engine, board, depth - 1, alpha, beta, not maximizing_player, root_color,
+                                           ply + 1)
+        board.undo_move()
+        if maximizing_player:
+            if eval_score > best_score:
+                best_score, best_move = eval_score, move
+            alpha = max(alpha, best_score)
+        else:
+            if eval_score < best_score:
+                best_score, best_move = eval_score, move
+            beta = min(beta, eval_score)
+        if alpha >= beta:
+            engine.record_cutoff(move, depth, ply, board.current_player, index)
+            break
+    flag = HASH_EXACT
+    if best_score <= original_alpha:
+        flag = HASH_ALPHA
+    elif best_score >= original_beta:
+        flag = HASH_BETA
+    engine.TRANSPOSITION_TABLE.store(key, depth, best_score, flag,
+                                     mirror_move(best_move) if mirrored and best_move is not None else best_move)
+    return best_score, best_move
+
+
+def bench_pvs(depth=7):
+    """
+    Nodes to a fixed depth: the old minimax alpha-beta against negamax PVS with
+    null-window scouts. Race cutoffs, the tablebase, LMR, futility pruning and
+    razoring are off for both, so both must return the same root scores.
+    """
+    import Engine_bit
+
+    print("--- principal variation search ---")
+    negamax_pvs = Engine_bit.pvs
+    minimax = (lambda board, depth_left, alpha, beta, ply=0:
+               legacy_minimax_pvs(Engine_bit, board, depth_left, alpha, beta, True, board.current_player, ply))
+    switches = ("RACE_CUTOFFS", "LMR_ENABLED", "FUTILITY_ENABLED", "RAZORING_ENABLED", "TABLEBASE")
+    saved = {name: getattr(Engine_bit, name) for name in switches}
+    totals = {}
+    scores = {}
+    try:
+        for name in switches:
+            setattr(Engine_bit, name, None if name == "TABLEBASE" else False)
+        for name, search in (("minimax", minimax), ("pvs", negamax_pvs)):
+            Engine_bit.pvs = search
+            totals[name] = [0, 0.0]
+            for position in POSITIONS:
+                move, score, nodes, elapsed = _search_fixed_depth(Engine_bit, _setup(position), depth)
+                totals[name][0] += nodes
+                totals[name][1] += elapsed
+                scores.setdefault(position, []).append(score)
+                print(f"  {name:>8} | {move_to_notation(move)} {score:>6} | {nodes:>8} nodes")
+    finally:
+        Engine_bit.pvs = negamax_pvs
+        for name, value in saved.items():
+            setattr(Engine_bit, name, value)
+    for position, (minimax_score, pvs_score) in scores.items():
+        if minimax_score != pvs_score:
+            raise AssertionError(f"{position}: minimax scores {minimax_score}, pvs {pvs_score}")
+    print("✅ same root score on every position")
+    for name, (nodes, elapsed) in totals.items():
+        print(f"{name:>10}: depth {depth} in {nodes} nodes, {elapsed:.3f}s")
+    print(f"  node reduction: {100 * (1 - totals['pvs'][0] / totals['minimax'][0]):.1f}%")
+
+
+# Forced pawn-race wins for the side to move (found by an unpruned search; the
+# last field is the depth at which it first proves the win). Several have more
+# than one winning first move, so _solves checks the played move against an
+# exhaustive search instead of a fixed answer.
+SOLVE_SUITE = [
+    ("Setup Wc2 Wc4 Wd2 Wa4 Wg3 Bg7 Bf6 Be5 Bc7", 8),
+    ("Setup Wa4 Wd5 Wc2 Wf5 Be6 Bh6 Bc4 Bf7", 6),
+    ("Setup Wd5 We4 Wf2 Wd4 Bg5 Bg7 Bf3", 6),
+    ("Setup Wa2 Wd5 Bb6 Bf5 Be5", 6),
+    ("Setup Wd2 Wh2 Wb4 Wg5 Be7 Bc3", 8),
+    ("Setup We3 Wh5 Be4 Bc4 Bc6 Be5 Bf4", 6),
+    ("Setup Wd3 Wa2 Wg4 Wb2 Ba7 Bh7 Be4 Bg5", 10),
+    ("Setup Wa5 We3 Wh4 Bc4 Bh6 Bh7 Bf6", 6),
+    ("Setup Wa3 Wf2 Bh6 Bb6", 10),
+    ("Setup Wg6 Wb6 Wd5 Bg7 Bh6 Bb7", 6),
+    ("Setup Wa2 Wa4 Wc5 Bh4 Bh6 Bd4", 6),
+    ("Setup We2 Wb5 Wf3 We3 Bb4 Bd6", 6),
+    ("Setup Wf3 Wh4 Wc5 Wh3 Bd5 Bg4 Ba6 Bf4 Bf6", 6),
+    ("Setup Wf4 Wa4 Wb5 Bb4 Ba5 Bf7 Bg5 Be6", 6),
+    ("Setup Wb3 Wd4 Ba7 Ba5 Bg7 Bg5 Bg6", 8),
+    ("Setup Wg3 Wh5 Bh4 Ba6", 6),
+]
+
+
+def _timed_search(engine, board, seconds):
+    """
+    Search board for at most seconds on a cleared table; returns (move, score, depth, nodes, seconds).
+    The tablebase is off: a root probe would answer the suite without searching it.
+    """
+    engine.TRANSPOSITION_TABLE.clear()
+    engine.QUIESCENCE_CACHE.clear()
+    engine.clear_heuristics()
+    tablebase, engine.TABLEBASE = engine.TABLEBASE, None
+    reached = [(0, None)]
+    start_time = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            move = engine.iterative_deepening_pvs(board, engine.MAX_SEARCH_DEPTH, board.current_player,
+                                                  time_limit=seconds, hard_limit=seconds,
+                                                  on_depth=lambda d, score, m: reached.append((d, score)))
+    finally:
+        engine.TABLEBASE = tablebase
+    depth, score = reached[-1]
+    return move, score, depth, engine.search_nodes, time.perf_counter() - start_time
+
+
+def bench_selective(seconds=2.0):
+    """
+    LMR, futility pruning and razoring switched on one by one: solve rate, nodes
+    and time to the proven win on SOLVE_SUITE, and depth reached in a fixed
+    time on POSITIONS.
+    """
+    import Engine_bit
+
+    print("--- selective search ---")
+    switches = ("LMR_ENABLED", "FUTILITY_ENABLED", "RAZORING_ENABLED")
+    defaults = [getattr(Engine_bit, name) for name in switches]
+    configs = (("none", ()), ("lmr", ("LMR_ENABLED",)), ("futility", ("FUTILITY_ENABLED",)),
+               ("razoring", ("RAZORING_ENABLED",)), ("all", switches))
+    try:
+        for label, enabled in configs:
+            for name in switches:
+                setattr(Engine_bit, name, name in enabled)
+            solved = solve_nodes = 0
+            solve_time = 0.0
+            for position, _ in SOLVE_SUITE:
+                move, score, depth, nodes, elapsed = _timed_search(Engine_bit, _setup(position), seconds)
+                if score is not None and score >= Engine_bit.CHECKMATE - 1000 and _solves(position, move):
+                    solved += 1
+                solve_nodes += nodes
+                solve_time += elapsed
+            depths = [_timed_search(Engine_bit, _setup(position), seconds)[2] for position in POSITIONS]
+            print(f"{label:>10}: solved {solved}/{len(SOLVE_SUITE)} in {solve_nodes} nodes, {solve_time:.2f}s | "
+                  f"mean depth {sum(depths) / len(depths):.2f} in {seconds:.1f}s {depths}")
+    finally:
+        for name, value in zip(switches, defaults):
+            setattr(Engine_bit, name, value)
+
+def _race_outcome(board, plies):
+    """Exhaustive search: 1 if the side to move wins within plies, -1 if it loses, 0 if undecided."""
+    color = board.current_player
+    # A promotion ends the game at once (is_game_over_2 only sees the mover's own).
+    if board.white_pawns & 0xFF if color == "B" else board.black_pawns & 0xFF00000000000000:
+        return -1
+    result = board.is_game_over_2(color)
+    if result is not None:
+        return 1 if result == color else -1
+    if plies == 0:
+        return 0
+    best = -1
+    for move in get_all_moves(board, color):
+        board.make_move(move, color)
+        best = max(best, -_race_outcome(board, plies - 1))
+        board.undo_move()
+        if best == 1:
+            break
+    return best
+
+
+def _game_value(board, cache):
+    """Exhaustive search to the end of the game: 1 if the side to move wins, -1 if it loses (there are no draws)."""
+    color = board.current_player
+    if board.white_pawns & 0xFF if color == "B" else board.black_pawns & 0xFF00000000000000:
+        return -1
+    result = board.is_game_over_2(color)
+    if result is not None:
+        return 1 if result == color else -1
+    value = cache.get(board.zobrist_hash)
+    if value is None:
+        value = -1
+        for move in get_all_moves(board, color):
+            board.make_move(move, color)
+            value = max(value, -_game_value(board, cache))
+            board.undo_move()
+            if value == 1:
+                break
+        cache[board.zobrist_hash] = value
+    return value
+
+
+def _solves(position, move):
+    """True when move keeps a forced win in position, however long it takes."""
+    board = _setup(position)
+    board.make_move(move, board.current_player)
+    return _game_value(board, {}) == -1
+
+
+def bench_race(positions=500, seconds=2.0):
+    """Check Eval_bit.pawn_race against exhaustive search, then time SOLVE_SUITE with and without race cutoffs."""
+    import Engine_bit
+
+    print("--- pawn races ---")
+    rng = random.Random(11)
+    decided = 0
+    for _ in range(positions):
+        board = ChessBoardChessBoard_Bit()
+        squares = rng.sample(range(8, 56), rng.randint(2, 6))
+        split = rng.randint(1, len(squares) - 1)
+        board.white_pawns = sum(1 << square for square in squares[:split])
+        board.black_pawns = sum(1 << square for square in squares[split:])
+        board.current_player = rng.choice("WB")
+        board._initialize_psqt_score()
+        board._initialize_zobrist_hash()
+        if board.is_game_over_2(board.current_player) is not None:
+            continue
+        race = pawn_race(board, board.current_player)
+        if race is None:
+            continue
+        winner, moves = race
+        expected = 1 if winner == board.current_player else -1
+        if _race_outcome(board, 2 * moves + 1) != expected:
+            board.print_board()
+            raise AssertionError(f"pawn_race({board.current_player}) = {race}, exhaustive search disagrees")
+        decided += 1
+    print(f"✅ {decided} decided races confirmed by exhaustive search")
+
+    try:
+        for cutoffs in (False, True):
+            Engine_bit.RACE_CUTOFFS = cutoffs
+            solved = total_nodes = 0
+            total_time = 0.0
+            for position, _ in SOLVE_SUITE:
+                move, score, depth, nodes, elapsed = _timed_search(Engine_bit, _setup(position), seconds)
+                solved += _solves(position, move)
+                total_nodes += nodes
+                total_time += elapsed
+            print(f"{'cutoffs' if cutoffs else 'search':>10}: solved {solved}/{len(SOLVE_SUITE)} "
+                  f"in {total_nodes} nodes, {total_time:.3f}s")
+    finally:
+        Engine_bit.RACE_CUTOFFS = True
+
+
+def bench_tablebase(positions=2000, max_plies=11, probes=100000):
+    """Check TB_bit entries (pawns_tb.bin, else a freshly generated 1v1 table) against exhaustive search."""
+    print("--- tablebase ---")
+    tablebase = open_tablebase()
+    if tablebase is None:
+        print(f"{TB_PATH} not found, generating 1 pawn per side")
+        tablebase = generate(1, verbose=False)
+    rng = random.Random(5)
+    boards = []
+    checked = 0
+    while len(boards) < positions:
+        board = ChessBoardChessBoard_Bit()
+        squares = rng.sample(range(8, 56), rng.randint(1, tablebase.max_pawns) + rng.randint(1, tablebase.max_pawns))
+        split = rng.randint(1, len(squares) - 1)
+        board.white_pawns = sum(1 << square for square in squares[:split])
+        board.black_pawns = sum(1 << square for square in squares[split:])
+        board.current_player = rng.choice("WB")
+        # Sometimes the opponent has just double-pushed: leave the en passant target behind it.
+        pushed = board.black_pawns & 0x000000FF00000000 if board.current_player == "W" else board.white_pawns & 0xFF000000
+        if pushed and rng.random() < 0.5:
+            square = (pushed & -pushed).bit_length() - 1
+            board.en_passant_target = 1 << (square - 8 if board.current_player == "W" else square + 8)
+        board._initialize_zobrist_hash()
+        result = tablebase.probe(board)
+        if result is None:
+            continue
+        boards.append(board)
+        win, plies = result
+        if plies > max_plies:
+            continue
+        expected = 1 if win else -1
+        if _race_outcome(board, plies) != expected or (plies and _race_outcome(board, plies - 1)):
+            board.print_board()
+            raise AssertionError(f"probe({board.current_player}) = {result}, exhaustive search disagrees")
+        checked += 1
+    print(f"✅ {checked} entries of up to {max_plies} plies confirmed by exhaustive search")
+
+    start = time.perf_counter()
+    for i in range(probes):
+        tablebase.probe(boards[i % len(boards)])
+    elapsed = time.perf_counter() - start
+    print(f"   probe: {probes} in {elapsed:.3f}s | {probes / elapsed:,.0f} probes/sec")
+
+
+def bench_mirror(depth=7):
+    """Check the incremental mirror_hash on a perft tree, then nodes to a fixed depth with and without canonical keys."""
+    import Engine_bit
+
+    print("--- file-mirror keys ---")
+    boards = []
+    for position in POSITIONS:
+        _collect_boards(_setup(position), 3, boards)
+    board = ChessBoardChessBoard_Bit()
+    for node in boards:
+        board.white_pawns, board.black_pawns = mirror_files(node.white_pawns), mirror_files(node.black_pawns)
+        board.en_passant_target = node.en_passant_target and mirror_files(node.en_passant_target)
+        board.current_player = node.current_player
+        board._initialize_zobrist_hash()
+        if board.zobrist_hash != node.mirror_hash:
+            node.print_board()
+            raise AssertionError("mirror_hash differs from the hash of the mirrored position")
+    print(f"✅ {len(boards)} positions: mirror_hash matches the mirrored position")
+
+    try:
+        for canonical in (False, True):
+            Engine_bit.CANONICAL_KEYS = canonical
+            total_nodes = total_time = 0
+            for position in POSITIONS:
+                move, score, nodes, elapsed = _search_fixed_depth(Engine_bit, _setup(position), depth)
+                total_nodes += nodes
+                total_time += elapsed
+            print(f"{'canonical' if canonical else 'plain':>10}: depth {depth} in {total_nodes} nodes, {total_time:.3f}s")
+    finally:
+        Engine_bit.CANONICAL_KEYS = True
+
+
+def bench_qcache(depth=7):
+    """Fixed-depth search with quiescence results in a 1 MB TT (depth 0) vs in their own cache."""
+    import Engine_bit
+
+    print("--- quiescence cache ---")
+    # A 1 MB table so the pressure on it shows in hashfull.
+    table = Engine_bit.TRANSPOSITION_TABLE
+    Engine_bit.TRANSPOSITION_TABLE = TranspositionTable(1)
+    try:
+        for enabled in (False, True):
+            Engine_bit.QCACHE_ENABLED = enabled
+            Engine_bit.QUIESCENCE_CACHE.clear()
+            total_nodes = total_time = 0
+            fills = []
+            for position in POSITIONS:
+                move, score, nodes, elapsed = _search_fixed_depth(Engine_bit, _setup(position), depth)
+                total_nodes += nodes
+                total_time += elapsed
+                fills.append(Engine_bit.TRANSPOSITION_TABLE.hashfull())
+            cache = Engine_bit.QUIESCENCE_CACHE
+            hits = f" | cache hits {Engine_bit.percent(cache.hits, cache.probes):.1f}%" if enabled else ""
+            print(f"{'qcache' if enabled else 'tt'}: depth {depth} in {total_nodes} nodes, {total_time:.3f}s | "
+                  f"TT hashfull {fills} permille{hits}")
+    finally:
+        Engine_bit.QCACHE_ENABLED = True
+        Engine_bit.TRANSPOSITION_TABLE = table
+
+
+def bench_evalcache(depth=7, repeats=3):
+    """Fixed-depth search with and without Eval_bit.EVAL_CACHE (best of repeats); same nodes, less time."""
+    import Engine_bit
+
+    print("--- evaluation cache ---")
+    cache = Eval_bit.EVAL_CACHE
+    best = {}
+    try:
+        for _ in range(repeats):
+            for cached in (False, True):
+                Eval_bit.EVAL_CACHE = EvalCache() if cached else None
+                total_nodes = total_time = 0
+                for position in POSITIONS:
+                    move, score, nodes, elapsed = _search_fixed_depth(Engine_bit, _setup(position), depth)
+                    total_nodes += nodes
+                    total_time += elapsed
+                hits = f" | hits {Eval_bit.EVAL_CACHE.hit_rate():.1f}% of {Eval_bit.EVAL_CACHE.probes}" if cached else ""
+                if cached not in best or total_time < best[cached][1]:
+                    best[cached] = (total_nodes, total_time, hits)
+    finally:
+        Eval_bit.EVAL_CACHE = cache
+    for cached, (total_nodes, total_time, hits) in best.items():
+        print(f"{'cached' if cached else 'uncached':>9}: depth {depth} in {total_nodes} nodes, {total_time:.3f}s{hits}")
+
+
+BENCHMARKS = {
+    "movegen": bench_movegen,
+    "makemove": bench_makemove,
+    "eval": bench_eval,
+    "tt": bench_tt,
+    "smp": bench_smp,
+    "ordering": bench_ordering,
+    "pvs": bench_pvs,
+    "selective": bench_selective,
+    "race": bench_race,
+    "tablebase": bench_tablebase,
+    "mirror": bench_mirror,
+    "qcache": bench_qcache,
+    "evalcache": bench_evalcache,
+}
+
+if __name__ == "__main__":
+    selected = sys.argv[1:] or list(BENCHMARKS)
+    for name in selected:
+        BENCHMARKS[name]()
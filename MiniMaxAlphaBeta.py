@@ -1,8 +1,7 @@
 import random
-import socket
-import pygame
 import time
 from board import ChessBoard
+from Net_bit import connect
 
 CHECKMATE = 100000000000
 LOSE =     -100000000000
@@ -355,40 +354,40 @@ def iterative_deepening_minimax(board, max_depth, player_color, time_limit=100):
 def main():
 
     # Step 1: Connect to the server
-    client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    client_socket.connect(('127.0.0.1', 9999))
+    client_socket = connect()
     
     running = True
     game_active = False  # Game starts after "Begin"
-    clock = pygame.time.Clock()
     board = ChessBoard()  # Initialize the client's board to match the server
     
     while running :
         
         
-        data = client_socket.recv(1024).decode()
+        data = client_socket.recv()
+        if data is None:  # the server closed the connection
+            break
 
         #? Step 2: Confirm connection
         if data == "Connected to the server!":
-            client_socket.send("OK".encode())
+            client_socket.send("OK")
 
         #? Step 2: Confirm color
         elif data.startswith("Color"):
             player_color = data.split()[1]
             print(f"My color is: {player_color}")
-            client_socket.send("OK".encode())
+            client_socket.send("OK")
                    
         #? Step 3: Handle Setup command
         elif data.startswith("Setup"):
             print(f"Setting up the board: {data}")
             board.initialize_custom_board(data)  # Initialize the board locally
-            client_socket.send("OK".encode())
+            client_socket.send("OK")
 
         #? Step 4: Handle game time
         elif data.isdigit():
             
             print(f"Game time set to {data} minutes.")
-            client_socket.send("OK".encode())
+            client_socket.send("OK")
             
         #? Step 5: Game begins
         elif data == "Begin":
@@ -408,7 +407,7 @@ def main():
             move_notation = move_to_notation(move)
             print(f"Agent move ({player_color}): {move_notation}")
             
-            client_socket.send(move_notation.encode())
+            client_socket.send(move_notation)
             
             # ✅ Apply the move to the internal board
             board.move_pawn(move[0], move[1], player_color)
@@ -443,7 +442,6 @@ def main():
 
 
     client_socket.close()
-    pygame.quit()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,65 @@
+import socket
+
+# ---------------------------
+# Message framing for the server/client protocol: every message is one line of
+# text ending in "\n". TCP is a byte stream, so one recv may hold several
+# messages (a move followed by "Your turn") or part of one; MessageSocket
+# splits the stream back into messages, which lets a sender write several
+# messages without waiting for the peer between them.
+BUFFER_SIZE = 4096
+DELIMITER = b"\n"
+
+
+class MessageSocket:
+    """Newline-framed messages over a connected socket, read through one preallocated buffer."""
+
+    def __init__(self, sock):
+        self.sock = sock
+        if sock.family in (socket.AF_INET, socket.AF_INET6):
+            # Messages are tiny and latency-bound: do not let Nagle hold them back.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.buffer = bytearray(BUFFER_SIZE)
+        self.view = memoryview(self.buffer)
+        self.start = self.end = 0  # unread bytes are buffer[start:end]
+
+    def send(self, *messages):
+        """Send one or more messages in a single write."""
+        self.sock.sendall(b"".join(message.encode() + DELIMITER for message in messages))
+
+    def recv(self):
+        """Next message without its delimiter, or None once the peer has closed the connection."""
+        while True:
+            index = self.buffer.find(DELIMITER, self.start, self.end)
+            if index >= 0:
+                message = self.buffer[self.start:index].decode()
+                self.start = index + 1
+                if self.start == self.end:
+                    self.start = self.end = 0
+                return message
+            if self.start:
+                # Move the partial message to the front to make room behind it.
+                length = self.end - self.start
+                self.buffer[:length] = self.buffer[self.start:self.end]
+                self.start, self.end = 0, length
+            if self.end == len(self.buffer):
+                self.view.release()
+                self.buffer.extend(bytes(len(self.buffer)))
+                self.view = memoryview(self.buffer)
+            received = self.sock.recv_into(self.view[self.end:])
+            if not received:
+                return None
+            self.end += received
+
+    def expect_ok(self, count=1):
+        """Read count replies (all of them, so the stream stays in step); True when all are 'OK'."""
+        replies = [self.recv() for _ in range(count)]
+        return all(reply == "OK" for reply in replies)
+
+    def close(self):
+        self.view.release()
+        self.sock.close()
+
+
+def connect(host="127.0.0.1", port=9999):
+    """Connect to the game server; returns a MessageSocket."""
+    return MessageSocket(socket.create_connection((host, port)))
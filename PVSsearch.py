@@ -1,8 +1,7 @@
 import random
-import socket
-import pygame
 import time
 from board import ChessBoard
+from Net_bit import connect
 
 CHECKMATE = 100000000000
 LOSE =     -100000000000
@@ -344,28 +343,28 @@ def iterative_deepening_pvs(board, max_depth, player_color, time_limit=100):
 # Main Game Loop
 # ---------------------------
 def main():
-    client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    client_socket.connect(('127.0.0.1', 9999))
+    client_socket = connect()
     running = True
     game_active = False  # Game starts after "Begin"
-    clock = pygame.time.Clock()
     board = ChessBoard()  # Initialize board from board.py
 
     while running:
-        data = client_socket.recv(1024).decode()
+        data = client_socket.recv()
+        if data is None:  # the server closed the connection
+            break
         if data == "Connected to the server!":
-            client_socket.send("OK".encode())
+            client_socket.send("OK")
         elif data.startswith("Color"):
             player_color = data.split()[1]
             print(f"My color is: {player_color}")
-            client_socket.send("OK".encode())
+            client_socket.send("OK")
         elif data.startswith("Setup"):
             print(f"Setting up the board: {data}")
             board.initialize_custom_board(data)
-            client_socket.send("OK".encode())
+            client_socket.send("OK")
         elif data.isdigit():
             print(f"Game time set to {data} minutes.")
-            client_socket.send("OK".encode())
+            client_socket.send("OK")
         elif data == "Begin":
             print("Game is starting!")
             game_active = True
@@ -375,7 +374,7 @@ def main():
             move = iterative_deepening_pvs(board, max_depth=11, player_color=player_color, time_limit=1000)
             move_notation = move_to_notation(move)
             print(f"Agent move ({player_color}): {move_notation}")
-            client_socket.send(move_notation.encode())
+            client_socket.send(move_notation)
             board.move_pawn(move[0], move[1], player_color)
         elif data.startswith("TimeRemaining"):
             client_time_remaining = float(data.split()[1])
@@ -391,7 +390,6 @@ def main():
             board.move_pawn((start_row, start_col), (end_row, end_col), opponent_color)
 
     client_socket.close()
-    pygame.quit()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,88 @@
+import argparse
+import time
+from Board_bit import ChessBoardChessBoard_Bit, get_all_moves, move_to_notation, zobrist_current_player
+
+DEFAULT_SETUP = "Setup Wa2 Wb2 Wc2 Wd2 We2 Wf2 Wg2 Wh2 Ba7 Bb7 Bc7 Bd7 Be7 Bf7 Bg7 Bh7"
+
+
+def setup_board(setup_message, side="W"):
+    """Build a board from a Setup string with the given side to move."""
+    board = ChessBoardChessBoard_Bit()
+    board.initialize_custom_board(setup_message)
+    if side == "B":
+        board.current_player = "B"
+        board.zobrist_hash ^= zobrist_current_player[0] ^ zobrist_current_player[1]
+        board.mirror_hash ^= zobrist_current_player[0] ^ zobrist_current_player[1]
+    return board
+
+
+def is_terminal(board):
+    """The game ended with the last move (promotion, wipe-out or the side to move is stuck)."""
+    mover = "B" if board.current_player == "W" else "W"
+    return board.is_game_over(mover) is not None
+
+
+def perft(board, depth, bulk=False, table=None):
+    """
+    Count the leaf nodes of the move tree. Finished games count as leaves.
+    bulk: count the moves at depth 1 instead of making them.
+    table: dict of per-depth dicts keyed by the canonical (file-mirror) Zobrist key (hashed perft).
+    """
+    if depth == 0 or is_terminal(board):
+        return 1
+    if table is not None:
+        key = board.canonical_key()[0]
+        cached = table[depth].get(key)
+        if cached is not None:
+            return cached
+    moves = get_all_moves(board, board.current_player)
+    if bulk and depth == 1:
+        nodes = len(moves)
+    else:
+        nodes = 0
+        color = board.current_player
+        for move in moves:
+            board.make_move(move, color)
+            nodes += perft(board, depth - 1, bulk, table)
+            board.undo_move()
+    if table is not None:
+        table[depth][key] = nodes
+    return nodes
+
+
+def divide(board, depth, bulk=False, hashed=False):
+    """Perft per root move. Returns ([(move, nodes)], total, seconds)."""
+    table = [{} for _ in range(depth + 1)] if hashed else None
+    start_time = time.perf_counter()
+    results = []
+    color = board.current_player
+    if depth > 0 and not is_terminal(board):
+        for move in get_all_moves(board, color):
+            board.make_move(move, color)
+            results.append((move, perft(board, depth - 1, bulk, table)))
+            board.undo_move()
+    total = sum(nodes for _, nodes in results) if results else 1
+    return results, total, time.perf_counter() - start_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Perft / perft-divide for the bitboard engine.")
+    parser.add_argument("setup", nargs="?", default=DEFAULT_SETUP, help="Setup string, e.g. 'Setup Wa2 Bb7'")
+    parser.add_argument("depth", nargs="?", type=int, default=4)
+    parser.add_argument("--side", choices=("W", "B"), default="W", help="side to move")
+    parser.add_argument("--bulk", action="store_true", help="count moves at depth 1 without making them")
+    parser.add_argument("--hash", action="store_true", help="reuse subtree counts by Zobrist key")
+    args = parser.parse_args()
+
+    board = setup_board(args.setup, args.side)
+    board.print_board()
+    results, total, elapsed = divide(board, args.depth, args.bulk, args.hash)
+    for move, nodes in results:
+        print(f"{move_to_notation(move)}: {nodes}")
+    print(f"Moves: {len(results)}")
+    print(f"Nodes: {total}")
+    print(f"Time: {elapsed:.3f}s | {total / max(elapsed, 1e-9):,.0f} nodes/sec")
+
+
+if __name__ == "__main__":
+    main()
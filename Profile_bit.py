@@ -0,0 +1,103 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+# ---------------------------
+# Sampling profiler for one search at a time: a background thread reads the
+# searching thread's stack every SAMPLE_INTERVAL seconds. Python only hands
+# the GIL over every sys.getswitchinterval() (5 ms by default), so that is the
+# effective rate; the search itself runs unmodified.
+SAMPLE_INTERVAL = 0.001
+
+# Engine components by function name: a sample counts toward the component of
+# the innermost frame that has one, so helpers (e.g. move_score inside
+# order_moves) are charged to the component that called them.
+COMPONENTS = {
+    "get_all_moves": "movegen", "get_captures": "movegen", "_pawn_targets": "movegen", "_serialize": "movegen",
+    "make_move": "make_move", "undo_move": "make_move", "undo_to": "make_move",
+    "order_moves": "order_moves", "order_captures": "order_moves",
+    "evaluate_board": "evaluate", "_evaluate": "evaluate", "pawn_race": "evaluate", "fast_eval": "evaluate",
+    "is_game_over_2": "game_over", "has_moves": "game_over",
+    "tt_key": "tt", "canonical_key": "tt", "TranspositionTable.probe": "tt", "TranspositionTable.store": "tt",
+    "QuiescenceCache.probe": "tt", "QuiescenceCache.store": "tt",
+    "PawnTablebase.probe": "tablebase", "PawnTablebase.entry": "tablebase", "PawnTablebase.best_move": "tablebase",
+}
+
+
+def _frame_name(frame):
+    code = frame.f_code
+    module = os.path.splitext(os.path.basename(code.co_filename))[0]
+    return f"{module}.{getattr(code, 'co_qualname', code.co_name)}"
+
+
+class SearchProfiler:
+    """
+    start() before a search and stop(name) after it write, into directory:
+      name.txt     per-function self and cumulative time, hottest first
+      name.folded  collapsed stacks ("a;b;c count"), input for flamegraph.pl / speedscope
+    stop() returns the share of samples per component for the search telemetry.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.stacks = Counter()
+        self.thread = None
+        self.running = False
+
+    def start(self):
+        self.stacks = Counter()
+        self.target = threading.get_ident()
+        self.running = True
+        self.start_time = time.perf_counter()
+        self.thread = threading.Thread(target=self._sample, daemon=True)
+        self.thread.start()
+
+    def _sample(self):
+        target = self.target
+        stacks = self.stacks
+        while self.running:
+            frame = sys._current_frames().get(target)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_name(frame))
+                frame = frame.f_back
+            stacks[tuple(reversed(stack))] += 1
+            time.sleep(SAMPLE_INTERVAL)
+
+    def stop(self, name):
+        """Stop sampling and write name.txt / name.folded; returns {component: percent of samples}."""
+        self.running = False
+        self.thread.join()
+        elapsed = time.perf_counter() - self.start_time
+        total = sum(self.stacks.values())
+        if not total:
+            return {}
+        own = Counter()
+        cumulative = Counter()
+        components = Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            # Recursive functions (pvs, quiesce) count once per sample.
+            for function in set(stack):
+                cumulative[function] += count
+            for function in reversed(stack):
+                component = COMPONENTS.get(function.split(".", 1)[1])
+                if component is not None:
+                    components[component] += count
+                    break
+            else:
+                components["search"] += count
+        seconds = elapsed / total
+        with open(os.path.join(self.directory, f"{name}.txt"), "w") as f:
+            f.write(f"{total} samples in {elapsed:.3f}s\n")
+            f.write(f"{'self %':>7} {'self s':>8} {'cum %':>7} {'cum s':>8}  function\n")
+            for function, count in own.most_common():
+                f.write(f"{100 * count / total:7.2f} {count * seconds:8.3f} {100 * cumulative[function] / total:7.2f} "
+                        f"{cumulative[function] * seconds:8.3f}  {function}\n")
+        with open(os.path.join(self.directory, f"{name}.folded"), "w") as f:
+            for stack, count in self.stacks.items():
+                f.write(f"{';'.join(stack)} {count}\n")
+        return {component: round(100 * count / total, 1) for component, count in components.most_common()}
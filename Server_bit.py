@@ -1,19 +1,23 @@
 import socket
 import pygame
-from Board_bit import ChessBoardChessBoard_Bit
+from Net_bit import MessageSocket
+from Board_bit import ChessBoardChessBoard_Bit, notation_to_move
 from UserInterface_bit import UserInterface
 
 clients = []
 
+# Setup steps each client acknowledges with "OK": connection, color, setup and time.
+# They are sent back to back and the replies are checked once, before "Begin".
+HANDSHAKE_STEPS = 4
+
 def send_to_all_clients(message):
     """Send a message to both clients."""
     for client in clients:
-        client.send(message.encode())
+        client.send(message)
 
-def wait_for_ok(client, step_description):
-    """Wait for 'OK' from a client and handle errors."""
-    response = client.recv(1024).decode()
-    if response != "OK":
+def wait_for_ok(client, step_description, count=1):
+    """Wait for count 'OK' replies from a client and handle errors."""
+    if not client.expect_ok(count):
         print(f"Client failed to respond with OK during {step_description}.")
         client.close()
         exit()
@@ -59,14 +63,11 @@ def start_server():
     if mode == "1":
         # Server vs Client
         client_socket, client_address = server_socket.accept()
+        client_socket = MessageSocket(client_socket)
         clients.append(client_socket)
         print(f"Client connected from {client_address}")
-        client_socket.send("Connected to the server!".encode())
-        wait_for_ok(client_socket, "connection confirmation")
-
-        # 🔥 Send color assignment to the client
-        client_socket.send(f"Color {client_color}".encode())
-        wait_for_ok(client_socket, "color confirmation")
+        # 🔥 Greeting and color assignment in one write
+        client_socket.send("Connected to the server!", f"Color {client_color}")
         
         #! Initialize Pygame for server GUI
         pygame.init()
@@ -82,19 +83,16 @@ def start_server():
             print("Waiting for two agents to connect...")
             while len(clients) < 2:
                 client_socket, client_address = server_socket.accept()
+                client_socket = MessageSocket(client_socket)
                 clients.append(client_socket)
                 print(f"Player {len(clients)} connected from {client_address}")
-                client_socket.send("Connected to the server!".encode())
-                wait_for_ok(client_socket, f"connection confirmation for Player {len(clients)}")
+                client_socket.send("Connected to the server!")
 
             # ✅ Assign colors after both clients have connected
             print("Both players connected. Assigning colors...")
 
-            clients[0].send("Color W".encode())  # Player 1 is White
-            wait_for_ok(clients[0], "color assignment for Player 1")
-
-            clients[1].send("Color B".encode())  # Player 2 is Black
-            wait_for_ok(clients[1], "color assignment for Player 2")
+            clients[0].send("Color W")  # Player 1 is White
+            clients[1].send("Color B")  # Player 2 is Black
             
             # #! Initialize Pygame for Client vs Client GUI
             pygame.init()
@@ -111,8 +109,6 @@ def start_server():
     setup_message = input("Enter setup command (e.g., 'Setup Wa2 Wb2 Wc2 Wd2 We2 Wf2 Wg2 Wh2 Ba7 Bb7 Bc7 Bd7 Be7 Bf7 Bg7 Bh7'): ")
     Board.initialize_custom_board(setup_message)
     send_to_all_clients(setup_message)
-    for client in clients:
-        wait_for_ok(client, "setup confirmation")
 
     #! Step 3: Send game time
     game_time = input("Enter game time in minutes (e.g., 'Time 10'): ")
@@ -128,7 +124,7 @@ def start_server():
         
     
     for client in clients:
-        wait_for_ok(client, "time confirmation")
+        wait_for_ok(client, "connection, color, setup and time confirmation", HANDSHAKE_STEPS)
 
     #! Step 4: Begin the game
     begin_message = input(" Enter begin to the game...")
@@ -159,12 +155,12 @@ def start_server():
 
                 if server_time_remaining <= 0:
                     print("Server ran out of time. Client wins!")
-                    clients[0].send("exit".encode())
+                    clients[0].send("exit")
                     break
 
                 # Format move as e2e4
                 move_str = f"{chr(97 + move[1])}{8 - move[0]}{chr(97 + move[3])}{8 - move[2]}"
-                clients[0].send(move_str.encode())
+                clients[0].send(move_str)
                 
                 print(f"Server's move: {move_str}")
                 print(f"Time remaining for server: {server_time_remaining:.2f} seconds")
@@ -173,15 +169,15 @@ def start_server():
                 winner = Board.is_game_over(server_color)
                 if winner:
                     print(f"{'Server' if winner == server_color else 'Client'} wins!")
-                    clients[0].send("exit".encode())
+                    clients[0].send("exit")
                     break
                 Board.print_board()
 
                         
             else:
                 # Client's turn
-                clients[0].send("Your turn".encode())
-                move = clients[0].recv(1024).decode()
+                clients[0].send("Your turn")
+                move = clients[0].recv()
                 
                 # Calculate time taken
                 current_time2 = pygame.time.get_ticks() / 1000
@@ -191,28 +187,26 @@ def start_server():
 
                 if client_time_remaining <= 0:
                     print("Client ran out of time. Server wins!")
-                    clients[0].send("exit".encode())
+                    clients[0].send("exit")
                     break
 
 
                 # Send remaining time to the client
-                clients[0].send(f"TimeRemaining {client_time_remaining:.2f}".encode())
+                clients[0].send(f"TimeRemaining {client_time_remaining:.2f}")
 
                 print(f"Client's move: {move}")
                 print(f"Time remaining for client: {client_time_remaining:.2f} seconds")
 
                 # Apply the client's move on the server's GUI
-                start_col, start_row = ord(move[0]) - 97, 8 - int(move[1])
-                end_col, end_row = ord(move[2]) - 97, 8 - int(move[3])
                 # Board.move_pawn((start_row, start_col), (end_row, end_col), client_color)
                 # Apply the opponent's move permanently using the new make_move system.
-                Board.make_move((start_row, start_col), (end_row, end_col), client_color)
+                Board.make_move(notation_to_move(Board, move, client_color), client_color)
 
                 # 🔥 Check if the client wins
                 winner = Board.is_game_over(client_color)
                 if winner:
                     print(f"{'Client' if winner == client_color else 'Server'} wins!")
-                    clients[0].send("exit".encode())
+                    clients[0].send("exit")
                     break
                 
                 
@@ -232,23 +226,21 @@ def start_server():
             )
                     
             # Client vs Client
-            clients[player_index].send("Your turn".encode())
-            move = clients[player_index].recv(1024).decode()
+            clients[player_index].send("Your turn")
+            move = clients[player_index].recv()
             print(f"Player {current_player_color} move: {move}")
             
 
 
-            clients[1 - player_index].send(move.encode()) # Send move to client
+            clients[1 - player_index].send(move) # Send move to client
             
 
 
             # Apply the move to the GUI
-            start_col, start_row = ord(move[0]) - 97, 8 - int(move[1])
-            end_col, end_row = ord(move[2]) - 97, 8 - int(move[3])
             # Board.move_pawn((start_row, start_col), (end_row, end_col), current_player_color)
             
             # Apply the opponent's move permanently using the new make_move system.
-            Board.make_move((start_row, start_col), (end_row, end_col), current_player_color)
+            Board.make_move(notation_to_move(Board, move, current_player_color), current_player_color)
 
 
             current_time2 = pygame.time.get_ticks() / 1000
@@ -269,8 +261,8 @@ def start_server():
             winner = Board.is_game_over(current_player_color)
             if winner:
                 print(f"{'Client' if winner == client_color else 'Server'} wins!")
-                clients[0].send("exit".encode())
-                clients[1].send("exit".encode())
+                clients[0].send("exit")
+                clients[1].send("exit")
 
                 break
             
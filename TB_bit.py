@@ -0,0 +1,253 @@
+import argparse
+import itertools
+import mmap
+import os
+import time
+from math import comb
+from Board_bit import ChessBoardChessBoard_Bit, get_all_moves, mirror_files, MOVE_EN_PASSANT
+
+# ---------------------------
+# Pawn-only endgame tablebase
+# Every position with 1..TB_MAX_PAWNS pawns per side on rows 1-6, for both
+# sides to move. A game always ends (pawns only move forward) and cannot be
+# drawn: the side to move loses when it has no pawns or no moves, or when the
+# opponent has promoted, as in ChessBoard.is_game_over. Each position is one
+# byte: 0 = not in the table, else ((plies to the end + 1) << 1) | win, from
+# the side to move's point of view.
+#
+# File layout: MAGIC, the pawn limit, three zero bytes, then one section per
+# (white pawns, black pawns) count, each holding the white-to-move block and
+# the black-to-move block. Within a block a position is found at
+# canonical(white squares) * comb(48, black pawns) + rank(black squares),
+# ranks taken in the combinatorial number system over squares 8-55.
+#
+# A position and its file mirror (a <-> h) have the same value, so only one of
+# them is stored: the one whose white squares have the smaller rank (the black
+# squares decide when the white ones are symmetric). canonical() numbers just
+# those white square sets, which halves the file.
+#
+# En passant is not part of the index: a position with a capturable en
+# passant target is solved from its moves when it is probed, and one without
+# a capture available is the same as the position with no target.
+TB_MAX_PAWNS = 2
+TB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pawns_tb.bin")
+MAGIC = b"PWT2"  # PWTB: the same table without mirror canonicalization
+HEADER_BYTES = 8
+FIRST_SQUARE = 8
+SQUARES = 48
+DOMAIN_MASK = ((1 << SQUARES) - 1) << FIRST_SQUARE
+PROMOTION_ROWS = {"W": 0xFF, "B": 0xFF00000000000000}
+COMB = [[comb(n, k) for k in range(9)] for n in range(SQUARES + 1)]
+
+
+def square_rank(squares):
+    """Colex rank of a set of squares (a bitboard inside DOMAIN_MASK)."""
+    rank = 0
+    k = 1
+    squares >>= FIRST_SQUARE
+    while squares:
+        lsb = squares & -squares
+        rank += COMB[lsb.bit_length() - 1][k]
+        k += 1
+        squares ^= lsb
+    return rank
+
+
+def canonical_white_sets(count):
+    """List mapping square_rank(white squares) to its canonical number, -1 for mirrored sets; and the count."""
+    canonical = [-1] * comb(SQUARES, count)
+    number = 0
+    for squares in _square_sets(count):
+        rank = square_rank(squares)
+        if rank <= square_rank(mirror_files(squares)):
+            canonical[rank] = number
+            number += 1
+    return canonical, number
+
+
+def section_offsets(max_pawns):
+    """
+    {(white pawns, black pawns): byte offset of the white-to-move block}, the
+    file size, and canonical_white_sets for every white pawn count.
+    """
+    canonical = [None] + [canonical_white_sets(white) for white in range(1, max_pawns + 1)]
+    offsets = {}
+    offset = HEADER_BYTES
+    for white in range(1, max_pawns + 1):
+        for black in range(1, max_pawns + 1):
+            offsets[white, black] = offset
+            offset += 2 * canonical[white][1] * comb(SQUARES, black)
+    return offsets, offset, canonical
+
+
+class PawnTablebase:
+    """
+    Win/loss and distance to win (in plies) for pawn-only positions. table is
+    a bytearray while generating, or a read-only mmap of a generated file,
+    which every engine process can open and share through the page cache.
+    """
+
+    def __init__(self, table, max_pawns):
+        self.table = table
+        self.max_pawns = max_pawns
+        self.offsets, self.size, self.canonical = section_offsets(max_pawns)
+        self.hits = 0
+
+    def index(self, board):
+        """Byte offset of the position or its mirror (en passant ignored), or None outside the table."""
+        wp = board.white_pawns
+        bp = board.black_pawns
+        if (wp | bp) & ~DOMAIN_MASK:
+            return None
+        white = wp.bit_count()
+        black = bp.bit_count()
+        offset = self.offsets.get((white, black))
+        if offset is None:
+            return None
+        white_rank = square_rank(wp)
+        mirror_rank = square_rank(mirror_files(wp))
+        black_rank = square_rank(bp)
+        if mirror_rank < white_rank:
+            white_rank = mirror_rank
+            black_rank = square_rank(mirror_files(bp))
+        elif mirror_rank == white_rank:
+            black_rank = min(black_rank, square_rank(mirror_files(bp)))
+        canonical, white_sets = self.canonical[white]
+        black_positions = COMB[SQUARES][black]
+        index = offset + canonical[white_rank] * black_positions + black_rank
+        if board.current_player == "B":
+            index += white_sets * black_positions
+        return index
+
+    def _solve(self, board, index):
+        """Entry byte of the position, solving unknown children; stored when index is not None."""
+        player_color = board.current_player
+        if not (board.white_pawns if player_color == "W" else board.black_pawns):
+            return _encode(False, 0)
+        moves = get_all_moves(board, player_color)
+        if not moves:
+            return _encode(False, 0)
+        promotion_row = PROMOTION_ROWS[player_color]
+        fastest_win = slowest_loss = None
+        for move in moves:
+            if promotion_row >> ((move >> 6) & 0x3F) & 1:
+                fastest_win = 1
+                break
+            board.make_move(move, player_color)
+            child = self.entry(board)
+            board.undo_move()
+            plies = child >> 1  # the child's plies to the end, plus this move
+            if child & 1:
+                if slowest_loss is None or plies > slowest_loss:
+                    slowest_loss = plies
+            elif fastest_win is None or plies < fastest_win:
+                fastest_win = plies
+        value = _encode(True, fastest_win) if fastest_win is not None else _encode(False, slowest_loss)
+        if index is not None:
+            self.table[index] = value
+        return value
+
+    def entry(self, board):
+        """Entry byte of the position, solving it first when it is not stored."""
+        index = self.index(board)
+        if board.en_passant_target is not None and any(
+                move & MOVE_EN_PASSANT for move in get_all_moves(board, board.current_player)):
+            return self._solve(board, None)
+        if index is None:
+            return self._solve(board, None)
+        return self.table[index] or self._solve(board, index)
+
+    def probe(self, board):
+        """(win, plies to the end) for the side to move, or None when the position is not in the table."""
+        if self.index(board) is None:
+            return None
+        value = self.entry(board)
+        self.hits += 1
+        return bool(value & 1), (value >> 1) - 1
+
+    def best_move(self, board):
+        """(move, win, plies) for the side to move, or None when the position is not in the table."""
+        result = self.probe(board)
+        if result is None:
+            return None
+        win, plies = result
+        player_color = board.current_player
+        promotion_row = PROMOTION_ROWS[player_color]
+        for move in get_all_moves(board, player_color):
+            if promotion_row >> ((move >> 6) & 0x3F) & 1:
+                return move, True, 1
+            board.make_move(move, player_color)
+            child = self.entry(board)
+            board.undo_move()
+            if bool(child & 1) != win and (child >> 1) == plies:
+                return move, win, plies
+        return None
+
+
+def _encode(win, plies):
+    return ((plies + 1) << 1) | win
+
+
+def generate(max_pawns=TB_MAX_PAWNS, verbose=True):
+    """Solve every position of up to max_pawns pawns per side; returns an in-memory PawnTablebase."""
+    _, size, _ = section_offsets(max_pawns)
+    table = bytearray(size)
+    table[:HEADER_BYTES] = MAGIC + bytes([max_pawns, 0, 0, 0])
+    tablebase = PawnTablebase(table, max_pawns)
+    board = ChessBoardChessBoard_Bit()
+    start = time.time()
+    # Children of a position have fewer pawns or more advanced ones, so the
+    # positions form a DAG; entry() solves them depth-first before their parents.
+    for white in range(1, max_pawns + 1):
+        for black in range(1, max_pawns + 1):
+            solved = 0
+            for white_squares in _square_sets(white):
+                if square_rank(mirror_files(white_squares)) < square_rank(white_squares):
+                    continue
+                for black_squares in _square_sets(black):
+                    if white_squares & black_squares:
+                        continue
+                    for player_color in ("W", "B"):
+                        board.white_pawns = white_squares
+                        board.black_pawns = black_squares
+                        board.en_passant_target = None
+                        board.current_player = player_color
+                        tablebase.entry(board)
+                        solved += 1
+            if verbose:
+                print(f"{white}v{black}: {solved} positions | {time.time() - start:.1f}s")
+    return tablebase
+
+
+def _square_sets(count):
+    """Every bitboard of count pawns inside DOMAIN_MASK."""
+    for squares in itertools.combinations(range(FIRST_SQUARE, FIRST_SQUARE + SQUARES), count):
+        yield sum(1 << square for square in squares)
+
+
+def save(tablebase, path=TB_PATH):
+    with open(path, "wb") as f:
+        f.write(tablebase.table)
+
+
+def open_tablebase(path=TB_PATH):
+    """Memory-map a generated file read-only; None when it does not exist."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        table = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if table[:4] != MAGIC:
+        raise ValueError(f"{path} is not a pawn tablebase")
+    tablebase = PawnTablebase(table, table[4])
+    if len(table) != tablebase.size:
+        raise ValueError(f"{path} is truncated")
+    return tablebase
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the pawn-only endgame tablebase.")
+    parser.add_argument("--pawns", type=int, default=TB_MAX_PAWNS, help="maximum pawns per side")
+    parser.add_argument("--output", default=TB_PATH, help="tablebase file")
+    args = parser.parse_args()
+    save(generate(args.pawns), args.output)
+    print(f"Wrote {args.output}")
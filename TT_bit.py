@@ -0,0 +1,169 @@
+from multiprocessing import shared_memory
+
+HASH_EXACT, HASH_ALPHA, HASH_BETA = 0, 1, 2
+
+# Data word layout (64 bits):
+#   bits  0-6   depth
+#   bits  7-8   flag (HASH_EXACT / HASH_ALPHA / HASH_BETA)
+#   bits  9-23  best move (packed move, 0 = none)
+#   bits 24-63  score + SCORE_OFFSET
+# The key word holds zobrist_hash ^ data, so a slot torn by two processes
+# writing at once fails verification instead of returning a wrong entry.
+SCORE_OFFSET = 1 << 39
+DEPTH_MASK = 0x7F
+ENTRY_BYTES = 8 + 8 + 1  # key, data, generation
+BUCKET_BYTES = 2 * ENTRY_BYTES
+
+
+def table_bytes(size_mb):
+    """Bytes used by a table of size_mb megabytes: as many whole buckets as fit."""
+    return size_mb * 1024 * 1024 // BUCKET_BYTES * BUCKET_BYTES
+
+
+class TranspositionTable:
+    """
+    Fixed-size transposition table. Each Zobrist key maps to a bucket of two
+    slots: slot 0 keeps the deepest entry of the current search, and the entry
+    it displaces drops to slot 1, the always-replace slot. Entries from older
+    searches (generations) are overwritten first, so memory stays flat for the
+    whole game.
+
+    buffer: optional writable buffer of table_bytes(size_mb) bytes, e.g. a
+    SharedMemory block, so several processes can share one table without locks.
+
+    A store+probe takes about four times as long as on a dict (Microbench_bit.py
+    tt), but lookups are a small part of a search: the same benchmark's
+    fixed-depth searches run within 0-10% of the time they take on an unbounded
+    dict, in the same number of nodes.
+    """
+
+    def __init__(self, size_mb=64, buffer=None):
+        size = table_bytes(size_mb)
+        self.buckets = size // BUCKET_BYTES
+        self.slots = 2 * self.buckets
+        self.buffer = memoryview(bytearray(size) if buffer is None else buffer)[:size]
+        # Slot s is words[2s] (key ^ data) and words[2s + 1] (data): a bucket is
+        # 32 contiguous bytes, so a probe touches one cache line.
+        self.words = self.buffer[:16 * self.slots].cast('Q')
+        self.ages = self.buffer[16 * self.slots:]
+        self.generation = 0
+
+    def new_search(self):
+        """Age every stored entry by one search; call once per move played."""
+        self.generation = (self.generation + 1) & 0xFF
+
+    def clear(self):
+        self.buffer[:] = bytes(len(self.buffer))
+        self.generation = 0
+
+    def probe(self, key):
+        """Return (depth, score, flag, best_move) for key, or None."""
+        index = (key % self.buckets) << 2
+        words = self.words
+        data = words[index + 1]
+        if words[index] ^ data != key:
+            data = words[index + 3]
+            if words[index + 2] ^ data != key:
+                return None
+        if not data:
+            return None
+        return data & DEPTH_MASK, (data >> 24) - SCORE_OFFSET, (data >> 7) & 3, (data >> 9) & 0x7FFF or None
+
+    def store(self, key, depth, score, flag, best_move):
+        index = (key % self.buckets) << 2
+        words = self.words
+        ages = self.ages
+        age = index >> 1
+        generation = self.generation
+        data = words[index + 1]
+        word = (((score + SCORE_OFFSET) << 24) | ((best_move or 0) << 9)
+                | (flag << 7) | (depth if depth < DEPTH_MASK else DEPTH_MASK))
+        if words[index] ^ data != key:
+            in_slot_1 = words[index + 2] ^ words[index + 3] == key
+            if (data & DEPTH_MASK) > depth and ages[age] == generation:
+                # Slot 0 holds a deeper entry of this search: take (or update) slot 1.
+                words[index + 3] = word
+                words[index + 2] = key ^ word
+                ages[age + 1] = generation
+                return
+            # Slot 0 goes to the new entry and the one it displaces drops to slot 1,
+            # unless that would put a stale entry over a current one. A copy of
+            # the position in slot 1 is always overwritten, so it is never held twice.
+            if data and (in_slot_1 or ages[age] == generation or ages[age + 1] != generation):
+                words[index + 3] = data
+                words[index + 2] = words[index]
+                ages[age + 1] = ages[age]
+            elif in_slot_1:
+                words[index + 3] = words[index + 2] = 0
+        words[index + 1] = word
+        words[index] = key ^ word
+        ages[age] = generation
+
+    def hashfull(self):
+        """Permille of the first 1000 slots written during the current search."""
+        sample = min(1000, len(self.ages))
+        generation = self.generation
+        used = sum(1 for i in range(sample) if self.ages[i] == generation and self.words[2 * i + 1])
+        return used * 1000 // sample
+
+    def release(self):
+        """Drop the views into the buffer; required before closing a SharedMemory block."""
+        for view in (self.words, self.ages, self.buffer):
+            view.release()
+
+
+# Quiescence cache data word: bits 0-1 flag, bits 2-3 quiescence depth,
+# bits 4-63 score + SCORE_OFFSET. Keys are stored XORed with the data word as above.
+QCACHE_ENTRY_BYTES = 8 + 8
+
+
+class QuiescenceCache:
+    """
+    Small direct-mapped cache of quiescence results, kept apart from the
+    TranspositionTable so the many leaf results never evict interior entries.
+    Always-replace: one slot per index, the newest result wins. Results depend
+    on the quiescence depth (stand-pat and the depth cut-off change with it),
+    so an entry only answers probes at the depth it was stored at.
+    """
+
+    def __init__(self, size_mb=4):
+        slots = 1
+        while slots * 2 * QCACHE_ENTRY_BYTES <= size_mb * 1024 * 1024:
+            slots *= 2
+        self.buffer = memoryview(bytearray(slots * QCACHE_ENTRY_BYTES))
+        self.mask = slots - 1
+        self.keys = self.buffer[:8 * slots].cast('Q')
+        self.data = self.buffer[8 * slots:].cast('Q')
+        self.probes = self.hits = 0
+
+    def clear(self):
+        self.buffer[:] = bytes(len(self.buffer))
+        self.probes = self.hits = 0
+
+    def probe(self, key, q_depth):
+        """Return (score, flag) stored for key at q_depth, or None."""
+        self.probes += 1
+        index = key & self.mask
+        data = self.data[index]
+        if not data or self.keys[index] ^ data != key or (data >> 2) & 3 != q_depth:
+            return None
+        self.hits += 1
+        return (data >> 4) - SCORE_OFFSET, data & 3
+
+    def store(self, key, q_depth, score, flag):
+        index = key & self.mask
+        word = ((score + SCORE_OFFSET) << 4) | (q_depth << 2) | flag
+        self.data[index] = word
+        self.keys[index] = key ^ word
+
+
+def create_shared_table(size_mb=64):
+    """Allocate a table in shared memory. Returns (table, SharedMemory); other processes attach by name."""
+    block = shared_memory.SharedMemory(create=True, size=table_bytes(size_mb))
+    return TranspositionTable(size_mb, block.buf), block
+
+
+def attach_shared_table(name, size_mb=64):
+    """Open a table created by create_shared_table in another process."""
+    block = shared_memory.SharedMemory(name=name)
+    return TranspositionTable(size_mb, block.buf), block
@@ -0,0 +1,24 @@
+import json
+import sys
+import time
+
+
+class Telemetry:
+    """
+    Search statistics as JSON lines, one object per event. path "-" writes to
+    stdout; any other path is appended to, line-buffered so a crashed agent
+    still leaves complete lines behind. Engines keep a module-level sink that
+    is None when telemetry is off, so the only cost then is the None check.
+    """
+
+    def __init__(self, path="-"):
+        self.stream = sys.stdout if path == "-" else open(path, "a", buffering=1)
+
+    def emit(self, event, **fields):
+        record = {"event": event, "ts": round(time.time(), 3)}
+        record.update(fields)
+        self.stream.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def close(self):
+        if self.stream is not sys.stdout:
+            self.stream.close()
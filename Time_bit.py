@@ -0,0 +1,81 @@
+import time
+
+# Clock handling
+MOVE_OVERHEAD = 0.05      # seconds lost per move to the socket round trip
+RESERVE_FRACTION = 0.05   # part of the clock never budgeted
+MAX_MOVE_FRACTION = 0.25  # hard limit never exceeds this part of the usable clock
+HARD_FACTOR = 4.0         # hard limit = soft budget * HARD_FACTOR (before the cap above)
+FALLBACK_LIMITS = (5.0, 15.0)  # (soft, hard) seconds while the clock is unknown
+
+# Game phase: expected own moves left grows with the pawns on the board.
+MIN_MOVES_TO_GO = 5
+MOVES_PER_PAWN = 1.0
+
+# Iteration control
+NEW_ITERATION_FRACTION = 0.5  # the next depth usually costs more than all previous ones
+STABLE_ITERATIONS = 4         # same best move this many depths in a row ...
+STABLE_FRACTION = 0.3         # ... and this part of the budget used: stop early
+SCORE_DROP = 50               # eval units (100 = one pawn) that count as a failing score
+MAX_EXTENSION = 3.0           # budget multiplier cap for unstable searches
+
+
+class TimeManager:
+    """
+    Per-move budgets from the remaining game clock. The server's
+    'TimeRemaining <secs>' messages are authoritative; in between, the time
+    spent thinking is deducted locally. Each search gets a soft budget
+    (remaining / expected moves left) that grows while the best move or the
+    score is unstable and shrinks when the best move stays the same, and a
+    hard limit for aborting the running iteration.
+    """
+
+    def __init__(self):
+        self.remaining = None
+        self.soft = self.hard = 0.0
+        self.move_start = 0.0
+
+    def set_remaining(self, seconds):
+        self.remaining = seconds
+
+    def moves_to_go(self, board):
+        pawns = (board.white_pawns | board.black_pawns).bit_count()
+        return MIN_MOVES_TO_GO + pawns * MOVES_PER_PAWN
+
+    def start(self, board):
+        """Begin a move; returns (soft, hard) seconds."""
+        self.move_start = time.time()
+        self.last_move = None
+        self.last_score = None
+        self.stable = 0
+        self.changes = 0.0
+        if self.remaining is None:
+            self.soft, self.hard = FALLBACK_LIMITS
+            return self.soft, self.hard
+        usable = max(self.remaining * (1 - RESERVE_FRACTION) - MOVE_OVERHEAD, 0.01)
+        self.soft = usable / self.moves_to_go(board)
+        self.hard = max(self.soft, min(self.soft * HARD_FACTOR, usable * MAX_MOVE_FRACTION))
+        return self.soft, self.hard
+
+    def should_stop(self, depth, score, move, elapsed):
+        """Called after each completed depth; True when no new iteration should start."""
+        # Best-move changes decay by half per iteration so only recent ones extend the budget.
+        self.changes *= 0.5
+        if self.last_move is not None and move != self.last_move:
+            self.changes += 1
+            self.stable = 0
+        else:
+            self.stable += 1
+        dropped = self.last_score is not None and score < self.last_score - SCORE_DROP
+        self.last_move = move
+        self.last_score = score
+
+        budget = self.soft * min(1 + 0.5 * self.changes + (0.5 if dropped else 0), MAX_EXTENSION)
+        budget = min(budget, self.hard)
+        if self.stable >= STABLE_ITERATIONS and elapsed >= self.soft * STABLE_FRACTION:
+            return True
+        return elapsed >= budget * NEW_ITERATION_FRACTION
+
+    def finish(self):
+        """End a move: deduct the thinking time until the server reports the clock again."""
+        if self.remaining is not None:
+            self.remaining -= time.time() - self.move_start + MOVE_OVERHEAD
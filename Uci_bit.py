@@ -0,0 +1,201 @@
+import argparse
+import sys
+import threading
+import time
+from Board_bit import ChessBoardChessBoard_Bit, move_to_notation, notation_to_move
+import Engine_bit
+from Engine_bit import iterative_deepening_pvs, clear_heuristics, predict_reply, MAX_SEARCH_DEPTH
+from Time_bit import TimeManager
+from TT_bit import TranspositionTable
+
+ENGINE_NAME = "PawnsGame aspiration PVS"
+START_SETUP = "Setup Wa2 Wb2 Wc2 Wd2 We2 Wf2 Wg2 Wh2 Ba7 Bb7 Bc7 Bd7 Be7 Bf7 Bg7 Bh7"
+# go parameters that take a number; winc, binc and movestogo are accepted but unused.
+GO_LIMITS = ("wtime", "btime", "winc", "binc", "movestogo", "depth", "nodes", "movetime")
+
+
+# ---------------------------
+# Long-running engine speaking a UCI-style protocol on stdin/stdout:
+#   uci | isready | ucinewgame | quit
+#   position (startpos | setup Wa2 ... Bh7) [moves a2a4 b7b5 ...]   white moves first
+#   go [wtime MS] [btime MS] [movetime MS] [depth N] [nodes N] [infinite] [ponder]   other tokens are ignored
+#   stop | ponderhit
+# The transposition table, tablebase and evaluation cache live as long as the
+# process, so they stay warm across moves and games.
+class UciEngine:
+    def __init__(self, output=sys.stdout):
+        self.output = output
+        self.output_lock = threading.Lock()
+        self.board = None
+        self.thread = None
+        # stop and ponderhit both end a ponder search; stop_requested tells them apart.
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.stop_requested = False
+        self.pondering = False  # a "go ponder" search is waiting for ponderhit or stop
+        self.time_manager = TimeManager()
+        self.position("startpos")
+
+    def send(self, line):
+        with self.output_lock:
+            self.output.write(line + "\n")
+            self.output.flush()
+
+    def run(self, lines):
+        for line in lines:
+            words = line.split()
+            if not words:
+                continue
+            command, args = words[0], words[1:]
+            if command == "uci":
+                self.send(f"id name {ENGINE_NAME}")
+                self.send("uciok")
+            elif command == "isready":
+                self.send("readyok")
+            elif command == "ucinewgame":
+                self.stop()
+                clear_heuristics()
+            elif command == "position":
+                self.stop()
+                self.position(*args)
+            elif command == "go":
+                self.stop()
+                self.go(args)
+            elif command == "stop":
+                self.stop()
+            elif command == "ponderhit":
+                with self.lock:
+                    if self.pondering:
+                        self.pondering = False
+                        self.wake.set()
+                        Engine_bit.SEARCH_STOP[0] = 1
+            elif command == "quit":
+                break
+        self.stop()
+
+    def position(self, *args):
+        words = list(args)
+        moves = []
+        if "moves" in words:
+            split = words.index("moves")
+            words, moves = words[:split], words[split + 1:]
+        if words and words[0] == "setup":
+            setup = "Setup " + " ".join(words[1:])
+        else:
+            setup = START_SETUP
+        board = ChessBoardChessBoard_Bit()
+        board.initialize_custom_board(setup)
+        for notation in moves:
+            board.make_move(notation_to_move(board, notation, board.current_player), board.current_player)
+        self.board = board
+
+    def go(self, args):
+        limits = {}
+        flags = set()
+        ignored = []
+        words = iter(args)
+        for word in words:
+            if word in ("infinite", "ponder"):
+                flags.add(word)
+            elif word in GO_LIMITS:
+                value = next(words, None)
+                if value is not None and value.lstrip("-").isdigit():
+                    limits[word] = int(value)
+                else:
+                    ignored.append(word if value is None else f"{word} {value}")
+            else:
+                # searchmoves and its move list, or anything else this engine does not support.
+                ignored.append(word)
+        if ignored:
+            print(f"go: ignoring {' '.join(ignored)}")
+        self.stop_requested = False
+        self.pondering = "ponder" in flags
+        self.wake.clear()
+        Engine_bit.SEARCH_STOP[0] = 0
+        self.thread = threading.Thread(target=self._search, args=(self.board, limits, flags), daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Abort the running search; it still reports its bestmove."""
+        if self.thread is None:
+            return
+        with self.lock:
+            self.stop_requested = True
+            self.pondering = False
+            self.wake.set()
+            Engine_bit.SEARCH_STOP[0] = 1
+        self.thread.join()
+        Engine_bit.SEARCH_STOP[0] = 0
+        self.thread = None
+
+    def _search(self, board, limits, flags):
+        player_color = board.current_player
+        start_time = time.time()
+        completed = []
+
+        def report(depth, score, move):
+            completed.append((depth, score, move))
+            elapsed = time.time() - start_time
+            nodes = Engine_bit.search_nodes
+            self.send(f"info depth {depth} score cp {score} nodes {nodes} nps {int(nodes / max(elapsed, 1e-9))} "
+                      f"time {int(elapsed * 1000)} pv {move_to_notation(move)}")
+
+        Engine_bit.TRANSPOSITION_TABLE.new_search()
+        if "ponder" in flags:
+            # Search the predicted position until stop or ponderhit; a hit resumes
+            # the timed search from the deepest pondered iteration.
+            move = iterative_deepening_pvs(board, MAX_SEARCH_DEPTH, player_color, float("inf"), on_depth=report,
+                                           verbose=False)
+            self.wake.wait()
+            with self.lock:
+                if self.stop_requested:
+                    self._best_move(board, move)
+                    return
+                Engine_bit.SEARCH_STOP[0] = 0
+            start_time = time.time()
+        seed = completed[-1] if completed else None
+        time_limit, hard_limit, time_manager = float("inf"), None, None
+        if "movetime" in limits:
+            time_limit = hard_limit = limits["movetime"] / 1000
+        elif "infinite" not in flags and ("wtime" in limits or "btime" in limits):
+            clock = limits.get("wtime" if player_color == "W" else "btime")
+            if clock is not None:
+                time_manager = self.time_manager
+                time_manager.set_remaining(clock / 1000)
+        move = iterative_deepening_pvs(board, limits.get("depth", MAX_SEARCH_DEPTH), player_color, time_limit,
+                                       on_depth=report, verbose=False, hard_limit=hard_limit,
+                                       time_manager=time_manager, seed=seed, node_limit=limits.get("nodes"))
+        self._best_move(board, move)
+
+    def _best_move(self, board, move):
+        if move is None:
+            self.send("bestmove none")
+            return
+        line = f"bestmove {move_to_notation(move)}"
+        root_ply = board.ply
+        player_color = board.current_player
+        board.make_move(move, player_color)
+        # is_game_over also sees a game our own move ended by promotion.
+        if board.is_game_over(player_color) is None:
+            reply = predict_reply(board, board.current_player)
+            if reply is not None:
+                line += f" ponder {move_to_notation(reply)}"
+        board.undo_to(root_ply)
+        self.send(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pawn-game engine speaking a UCI-style protocol on stdin/stdout.")
+    parser.add_argument("--hash", type=int, default=Engine_bit.TT_SIZE_MB, metavar="MB",
+                        help="transposition table size, kept for the life of the process")
+    args = parser.parse_args()
+    if args.hash != Engine_bit.TT_SIZE_MB:
+        Engine_bit.TRANSPOSITION_TABLE = TranspositionTable(args.hash)
+    output = sys.stdout
+    # Engine diagnostics print to stdout; keep the protocol stream clean.
+    sys.stdout = sys.stderr
+    UciEngine(output).run(sys.stdin)
+
+
+if __name__ == "__main__":
+    main()
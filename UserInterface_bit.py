@@ -1,6 +1,7 @@
 # UserInterface.py
 
 import pygame
+from Board_bit import move_from_positions, move_to_tuple
 
 # Define colors
 WHITE = (238, 238, 200)
@@ -91,10 +92,10 @@ class UserInterface:
                         end_pos = (row, col)
                         
                         if end_pos in valid_moves:
-                            stored_info = self.chessboard.make_move(start_pos, end_pos, self.playerColor)
-                            if stored_info is not None:
-                                move = (*start_pos, *end_pos)
-                                waiting_for_move = False
+                            packed_move = move_from_positions(self.chessboard, start_pos, end_pos, self.playerColor)
+                            self.chessboard.make_move(packed_move, self.playerColor)
+                            move = (*start_pos, *end_pos)
+                            waiting_for_move = False
                         else:
                             print("Invalid move")
                         self.selected_square = None
@@ -106,9 +107,9 @@ class UserInterface:
                             self.selected_square = (row, col)
                             # Generate valid moves for selected pawn
                             valid_moves = [
-                                (move[1][0], move[1][1])  # Extract destination positions
-                                for move in self.chessboard.get_all_moves(self.playerColor)
-                                if (move[0][0], move[0][1]) == (row, col)
+                                end  # Extract destination positions
+                                for start, end in map(move_to_tuple, self.chessboard.get_all_moves(self.playerColor))
+                                if start == (row, col)
                             ]
 
             self.drawComponent()